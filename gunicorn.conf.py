@@ -0,0 +1,34 @@
+"""
+Gunicorn configuration for App Rationalization Pro
+
+Picked up automatically by ``gunicorn web.app:app`` when started from the
+project root (as render.yaml does).
+"""
+
+import os
+import platform
+
+# gevent workers serve many I/O-bound requests at once (database queries, the
+# streaming chat endpoint); the worker monkey-patches the stdlib before it
+# imports the app, so web/app.py needs no patching of its own.
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gevent')
+# One process: chat sessions, lifecycle managers and background job registries
+# live in process memory, so a second worker would not see them. Concurrency
+# comes from gevent within the process; only raise WEB_CONCURRENCY once that
+# state is kept in a shared store.
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 1000))
+
+PYPY = platform.python_implementation() == 'PyPy'
+
+
+def post_fork(server, worker):
+    """Let psycopg2 yield to the gevent hub while it waits on PostgreSQL."""
+    if worker_class == 'gevent':
+        if PYPY:
+            # psycogreen patches the module named psycopg2; point it at the cffi port
+            from psycopg2cffi import compat
+            compat.register()
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+
@@ -6,6 +6,7 @@ Includes government edition models for agency hierarchy and public sector needs.
 """
 
 import uuid
+from collections import Counter
 from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import JSON
@@ -202,51 +203,91 @@ class Portfolio(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    applications = db.relationship('Application', backref='portfolio', lazy='dynamic', cascade='all, delete-orphan')
+    # Plain collection: routes choose the loader per query (e.g. selectinload)
+    applications = db.relationship('Application', back_populates='portfolio', cascade='all, delete-orphan')
+
+    # Columns read by to_dict(), in the order dict_from_row() unpacks them
+    DICT_COLUMNS = (
+        'id', 'name', 'organization', 'description', 'agency_id', 'portfolio_type',
+        'sector', 'fiscal_year', 'total_applications', 'total_cost', 'average_score',
+        'invest_count', 'tolerate_count', 'migrate_count', 'eliminate_count',
+        'created_at', 'updated_at'
+    )
 
     def to_dict(self):
+        return self.dict_from_row([getattr(self, column) for column in self.DICT_COLUMNS])
+
+    @staticmethod
+    def dict_from_row(row) -> dict:
+        """Serialize DICT_COLUMNS values, from an instance or a column select."""
+        (id, name, organization, description, agency_id, portfolio_type,
+         sector, fiscal_year, total_applications, total_cost, average_score,
+         invest_count, tolerate_count, migrate_count, eliminate_count,
+         created_at, updated_at) = row
         return {
-            'id': self.id,
-            'name': self.name,
-            'organization': self.organization,
-            'description': self.description,
-            'agency_id': self.agency_id,
-            'portfolio_type': self.portfolio_type,
-            'sector': self.sector,
-            'fiscal_year': self.fiscal_year,
-            'total_applications': self.total_applications,
-            'total_cost': self.total_cost,
-            'average_score': self.average_score,
+            'id': id,
+            'name': name,
+            'organization': organization,
+            'description': description,
+            'agency_id': agency_id,
+            'portfolio_type': portfolio_type,
+            'sector': sector,
+            'fiscal_year': fiscal_year,
+            'total_applications': total_applications,
+            'total_cost': total_cost,
+            'average_score': average_score,
             'time_distribution': {
-                'Invest': self.invest_count,
-                'Tolerate': self.tolerate_count,
-                'Migrate': self.migrate_count,
-                'Eliminate': self.eliminate_count
+                'Invest': invest_count,
+                'Tolerate': tolerate_count,
+                'Migrate': migrate_count,
+                'Eliminate': eliminate_count
             },
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': created_at.isoformat() if created_at else None,
+            'updated_at': updated_at.isoformat() if updated_at else None
         }
 
     def update_metrics(self):
-        """Recalculate portfolio metrics from applications."""
-        apps = self.applications.all()
+        """Recalculate portfolio metrics from applications.
+
+        Reads just the three metric columns (autoflushing pending changes first)
+        rather than loading the applications collection.
+        """
+        self.apply_metrics(db.session.execute(
+            db.select(Application.cost, Application.composite_score, Application.time_category)
+            .where(Application.portfolio_id == self.id)
+        ).all())
+
+    def apply_metrics(self, apps: list):
+        """Set portfolio metrics from (cost, composite_score, time_category) tuples."""
         self.total_applications = len(apps)
 
         if apps:
-            self.total_cost = sum(app.cost or 0 for app in apps)
-            scores = [app.composite_score for app in apps if app.composite_score]
+            self.total_cost = sum(cost or 0 for cost, _, _ in apps)
+            scores = [score for _, score, _ in apps if score]
             self.average_score = round(sum(scores) / len(scores), 2) if scores else 0
 
             # TIME distribution
-            self.invest_count = sum(1 for app in apps if app.time_category == 'Invest')
-            self.tolerate_count = sum(1 for app in apps if app.time_category == 'Tolerate')
-            self.migrate_count = sum(1 for app in apps if app.time_category == 'Migrate')
-            self.eliminate_count = sum(1 for app in apps if app.time_category == 'Eliminate')
+            categories = Counter(category for _, _, category in apps)
+            self.invest_count = categories['Invest']
+            self.tolerate_count = categories['Tolerate']
+            self.migrate_count = categories['Migrate']
+            self.eliminate_count = categories['Eliminate']
 
 
 class Application(db.Model):
     """Individual application in a portfolio."""
     __tablename__ = 'applications'
+    __table_args__ = (
+        # Portfolio listings ordered by score (ORDER BY composite_score DESC NULLS
+        # LAST, optionally with a LIMIT) walk an index instead of sorting. SQLite
+        # cannot declare NULLS LAST in an index but returns NULLs last when it
+        # scans backwards; PostgreSQL needs the order spelled out.
+        db.Index('ix_application_portfolio_score', 'portfolio_id', 'composite_score')
+        .ddl_if(callable_=lambda ddl, target, bind, **kw: kw['dialect'].name != 'postgresql'),
+        db.Index('ix_application_portfolio_score_desc', 'portfolio_id',
+                 db.text('composite_score DESC NULLS LAST'))
+        .ddl_if(dialect='postgresql'),
+    )
 
     id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
     portfolio_id = db.Column(db.String(36), db.ForeignKey('portfolios.id'), nullable=False)
@@ -299,79 +340,71 @@ class Application(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
+    portfolio = db.relationship('Portfolio', back_populates='applications')
     contracts = db.relationship('Contract', backref='application', lazy='dynamic', cascade='all, delete-orphan')
 
+    # Columns serialized by to_dict(), in output order
+    DICT_FIELDS = (
+        'id', 'portfolio_id', 'name', 'category', 'department', 'vendor', 'description',
+        # Enterprise scoring
+        'business_value', 'tech_health', 'cost', 'usage', 'security', 'strategic_fit', 'redundancy',
+        # Government scoring
+        'citizen_impact', 'mission_criticality', 'interoperability_score', 'data_sensitivity',
+        'compliance_requirements',
+        # Government metadata
+        'system_of_record', 'public_facing', 'shared_service', 'grant_funded', 'grant_expiration',
+        # Calculated scores
+        'composite_score', 'retention_score', 'time_category', 'time_rationale',
+        'time_bv_score', 'time_tq_score', 'recommendation', 'recommendation_rationale',
+        'gov_composite_score',
+        'created_at', 'updated_at'
+    )
+    # DICT_FIELDS serialized as ISO strings
+    DICT_DATE_FIELDS = frozenset({'grant_expiration', 'created_at', 'updated_at'})
+
     def to_dict(self):
+        """Serialize the application."""
+        return self.dict_from_row([getattr(self, field) for field in self.DICT_FIELDS])
+
+    @classmethod
+    def dict_from_row(cls, row) -> dict:
+        """Serialize DICT_FIELDS values, from an instance or a column select."""
         return {
-            'id': self.id,
-            'portfolio_id': self.portfolio_id,
-            'name': self.name,
-            'category': self.category,
-            'department': self.department,
-            'vendor': self.vendor,
-            'description': self.description,
-            # Enterprise scoring
-            'business_value': self.business_value,
-            'tech_health': self.tech_health,
-            'cost': self.cost,
-            'usage': self.usage,
-            'security': self.security,
-            'strategic_fit': self.strategic_fit,
-            'redundancy': self.redundancy,
-            # Government scoring
-            'citizen_impact': self.citizen_impact,
-            'mission_criticality': self.mission_criticality,
-            'interoperability_score': self.interoperability_score,
-            'data_sensitivity': self.data_sensitivity,
-            'compliance_requirements': self.compliance_requirements,
-            # Government metadata
-            'system_of_record': self.system_of_record,
-            'public_facing': self.public_facing,
-            'shared_service': self.shared_service,
-            'grant_funded': self.grant_funded,
-            'grant_expiration': self.grant_expiration.isoformat() if self.grant_expiration else None,
-            # Calculated scores
-            'composite_score': self.composite_score,
-            'retention_score': self.retention_score,
-            'time_category': self.time_category,
-            'time_rationale': self.time_rationale,
-            'time_bv_score': self.time_bv_score,
-            'time_tq_score': self.time_tq_score,
-            'recommendation': self.recommendation,
-            'recommendation_rationale': self.recommendation_rationale,
-            'gov_composite_score': self.gov_composite_score,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            field: value.isoformat() if value and field in cls.DICT_DATE_FIELDS else value
+            for field, value in zip(cls.DICT_FIELDS, row)
         }
 
+    # Columns read by RationalizationEngine
+    SCORING_INPUT_FIELDS = (
+        'name', 'business_value', 'tech_health', 'cost', 'usage', 'security',
+        'strategic_fit', 'redundancy'
+    )
+
     def to_scoring_dict(self):
         """Convert to dict format expected by scoring engine."""
-        return {
-            'name': self.name,
-            'business_value': self.business_value,
-            'tech_health': self.tech_health,
-            'cost': self.cost,
-            'usage': self.usage,
-            'security': self.security,
-            'strategic_fit': self.strategic_fit,
-            'redundancy': self.redundancy
-        }
+        return {field: getattr(self, field) for field in self.SCORING_INPUT_FIELDS}
+
+    # Columns written from RationalizationEngine output
+    SCORING_RESULT_FIELDS = (
+        'composite_score', 'retention_score', 'time_category', 'time_rationale',
+        'time_bv_score', 'time_tq_score', 'recommendation', 'recommendation_rationale'
+    )
 
     def apply_scoring_results(self, results: dict):
         """Apply results from RationalizationEngine to this model."""
-        self.composite_score = results.get('composite_score')
-        self.retention_score = results.get('retention_score')
-        self.time_category = results.get('time_category')
-        self.time_rationale = results.get('time_rationale')
-        self.time_bv_score = results.get('time_bv_score')
-        self.time_tq_score = results.get('time_tq_score')
-        self.recommendation = results.get('recommendation')
-        self.recommendation_rationale = results.get('recommendation_rationale')
+        for field in self.SCORING_RESULT_FIELDS:
+            setattr(self, field, results.get(field))
 
 
 class ComplianceResult(db.Model):
     """Compliance assessment result for an application."""
     __tablename__ = 'compliance_results'
+    __table_args__ = (
+        # Covers the per-framework average on the compliance page without
+        # touching the table; its prefix serves the portfolio/framework lookups
+        db.Index('ix_compliance_result_portfolio_framework_pct',
+                 'portfolio_id', 'framework', 'compliance_percentage'),
+    )
 
     id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
     application_id = db.Column(db.String(36), db.ForeignKey('applications.id'), nullable=False)
@@ -424,6 +457,10 @@ class ComplianceResult(db.Model):
 class CostAnalysis(db.Model):
     """Cost analysis result for a portfolio."""
     __tablename__ = 'cost_analyses'
+    __table_args__ = (
+        # Also serves "latest first" lookups (ORDER BY analyzed_at DESC) via a backward scan
+        db.Index('ix_cost_analysis_portfolio_analyzed', 'portfolio_id', 'analyzed_at'),
+    )
 
     id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
     portfolio_id = db.Column(db.String(36), db.ForeignKey('portfolios.id'), nullable=False)
@@ -728,6 +765,11 @@ class Vendor(db.Model):
     and security posture for risk assessment.
     """
     __tablename__ = 'vendors'
+    __table_args__ = (
+        db.Index('ix_vendor_portfolio_contract_end', 'portfolio_id', 'contract_end'),
+        db.Index('ix_vendor_portfolio_tier', 'portfolio_id', 'tier'),
+        db.Index('ix_vendor_portfolio_status', 'portfolio_id', 'status'),
+    )
 
     id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
     portfolio_id = db.Column(db.String(36), db.ForeignKey('portfolios.id'))
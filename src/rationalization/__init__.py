@@ -314,14 +314,8 @@ class RationalizationEngine:
         Returns:
             Dictionary with processed applications and summary statistics
         """
-        # Step 1: Calculate scores
-        scored = self.scoring.batch_calculate_scores(applications)
-
-        # Step 2: Apply TIME categorization
-        categorized = self.time.batch_categorize(scored)
-
-        # Step 3: Generate recommendations
-        recommended = self.recommendations.batch_generate_recommendations(categorized)
+        # Steps 1-3: Score, categorize and recommend
+        recommended = self._process_applications(applications)
 
         # Step 4: Build summary
         summary = {
@@ -357,11 +351,24 @@ class RationalizationEngine:
         Returns:
             Processed application with scores, TIME category, and recommendation
         """
-        result = self.process_portfolio([app])
-        if result['applications']:
-            return result['applications'][0]
+        # Same per-application steps as process_portfolio, without building a
+        # portfolio summary that would only be discarded
+        processed = self._process_applications([app])
+        if processed:
+            return processed[0]
         return app
 
+    def _process_applications(self, applications: list) -> list:
+        """Run scoring, TIME categorization and recommendations over applications."""
+        # Step 1: Calculate scores
+        scored = self.scoring.batch_calculate_scores(applications)
+
+        # Step 2: Apply TIME categorization
+        categorized = self.time.batch_categorize(scored)
+
+        # Step 3: Generate recommendations
+        return self.recommendations.batch_generate_recommendations(categorized)
+
     def reset(self):
         """Reset all counters for new analysis."""
         self.time.reset_counts()
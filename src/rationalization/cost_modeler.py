@@ -49,6 +49,31 @@ CATEGORY_MULTIPLIERS = {
     'Collaboration': {'licensing': 1.1, 'training': 1.3},
 }
 
+
+def _category_tco_shares(category: Optional[str]) -> tuple:
+    """TCO component shares for a category (renormalized to sum to 1.0) and
+    the same shares as display percentages."""
+    breakdown = TCOBreakdown().to_dict()
+
+    # Apply category-specific multipliers
+    if category in CATEGORY_MULTIPLIERS:
+        multipliers = CATEGORY_MULTIPLIERS[category]
+        for component, multiplier in multipliers.items():
+            if component in breakdown:
+                breakdown[component] *= multiplier
+
+        # Renormalize to ensure sum = 1.0
+        total = sum(breakdown.values())
+        breakdown = {k: v / total for k, v in breakdown.items()}
+
+    return breakdown, {k: round(v * 100, 1) for k, v in breakdown.items()}
+
+
+# Built once at import; any other category gets the industry averages
+_DEFAULT_TCO_SHARES = _category_tco_shares(None)
+_CATEGORY_TCO_SHARES = {category: _category_tco_shares(category) for category in CATEGORY_MULTIPLIERS}
+
+
 # Category to department mapping
 CATEGORY_TO_DEPARTMENT = {
     'Finance & Accounting': 'Finance Department',
@@ -100,20 +125,8 @@ class CostModeler:
             total_cost = app.get('cost', 0) or 0
             category = app.get('category', 'Other')
 
-            # Get base percentages
-            base = TCOBreakdown()
-            breakdown = base.to_dict()
-
-            # Apply category-specific multipliers
-            if category in CATEGORY_MULTIPLIERS:
-                multipliers = CATEGORY_MULTIPLIERS[category]
-                for component, multiplier in multipliers.items():
-                    if component in breakdown:
-                        breakdown[component] *= multiplier
-
-                # Renormalize to ensure sum = 1.0
-                total = sum(breakdown.values())
-                breakdown = {k: v / total for k, v in breakdown.items()}
+            # Category component shares (precomputed)
+            breakdown, percentages = _CATEGORY_TCO_SHARES.get(category, _DEFAULT_TCO_SHARES)
 
             # Calculate dollar amounts
             component_costs = {
@@ -127,7 +140,7 @@ class CostModeler:
                 'category': category,
                 'total_cost': total_cost,
                 'components': component_costs,
-                'percentages': {k: round(v * 100, 1) for k, v in breakdown.items()}
+                'percentages': dict(percentages)
             })
 
         self.tco_data = tco_breakdown
@@ -138,17 +138,17 @@ class AppLifecycle:
     owner: str = ""
     business_criticality: str = "medium"
 
-    def days_in_current_stage(self) -> int:
+    def days_in_current_stage(self, now: Optional[datetime] = None) -> int:
         """Calculate days in current stage."""
-        return (datetime.now() - self.current_stage_start).days
+        return ((now or datetime.now()) - self.current_stage_start).days
 
-    def is_overdue_for_transition(self) -> bool:
+    def is_overdue_for_transition(self, now: Optional[datetime] = None) -> bool:
         """Check if app has exceeded expected stage duration."""
-        return self.days_in_current_stage() > self.expected_stage_duration_days
+        return self.days_in_current_stage(now) > self.expected_stage_duration_days
 
-    def lifecycle_age_days(self) -> int:
+    def lifecycle_age_days(self, now: Optional[datetime] = None) -> int:
         """Calculate total lifecycle age in days."""
-        return (datetime.now() - self.inception_date).days
+        return ((now or datetime.now()) - self.inception_date).days
 
 
 class LifecycleManager:
@@ -244,6 +244,10 @@ class LifecycleManager:
         self.lifecycles: Dict[str, AppLifecycle] = {}
         self.transition_requests: Dict[str, TransitionRequest] = {}
         self.sunset_plans: Dict[str, SunsetPlan] = {}
+        # IDs of PENDING requests, in request order (dict used as an ordered set)
+        self._pending_ids: Dict[str, None] = {}
+        # Bumped on every mutation so callers can cache derived views
+        self.version = 0
 
     def register_application(
         self,
@@ -287,6 +291,7 @@ class LifecycleManager:
         ))
 
         self.lifecycles[app_id] = lifecycle
+        self.version += 1
         return lifecycle
 
     def get_lifecycle(self, app_id: str) -> Optional[AppLifecycle]:
@@ -333,10 +338,16 @@ class LifecycleManager:
         )
 
         self.transition_requests[request.id] = request
+        self._pending_ids[request.id] = None
         lifecycle.pending_transition = request
+        self.version += 1
 
         return request
 
+    def get_pending_transitions(self) -> List[TransitionRequest]:
+        """Get transition requests still awaiting review, oldest first."""
+        return [self.transition_requests[request_id] for request_id in self._pending_ids]
+
     def approve_transition(
         self,
         request_id: str,
@@ -359,9 +370,11 @@ class LifecycleManager:
             return False
 
         request.status = TransitionStatus.APPROVED
+        self._pending_ids.pop(request_id, None)
         request.reviewed_by = reviewed_by
         request.reviewed_date = datetime.now()
         request.review_notes = notes
+        self.version += 1
 
         return True
 
@@ -405,6 +418,7 @@ class LifecycleManager:
         # Update request
         request.status = TransitionStatus.COMPLETED
         request.completion_percentage = 100.0
+        self.version += 1
 
         return True
 
@@ -484,6 +498,7 @@ class LifecycleManager:
             health = HealthStatus.CRITICAL
 
         lifecycle.current_health = health
+        self.version += 1
         return health
 
     def create_sunset_plan(
@@ -529,6 +544,7 @@ class LifecycleManager:
 
         self.sunset_plans[plan.id] = plan
         lifecycle.sunset_plan = plan
+        self.version += 1
 
         return plan
 
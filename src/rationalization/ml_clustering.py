@@ -209,9 +209,14 @@ class MLClusteringEngine:
         ClusterCharacteristic.SECURITY_CONCERN: "Security Priority Group"
     }
 
-    def __init__(self, feature_weights: Optional[Dict[str, float]] = None):
-        """Initialize clustering engine with optional custom weights."""
+    def __init__(
+        self,
+        feature_weights: Optional[Dict[str, float]] = None,
+        distance_metric: DistanceMetric = DistanceMetric.EUCLIDEAN
+    ):
+        """Initialize clustering engine with optional custom weights and distance metric."""
         self.weights = feature_weights or self.DEFAULT_WEIGHTS.copy()
+        self.distance_metric = distance_metric
         self._applications: List[ApplicationFeatures] = []
         self._result: Optional[ClusteringResult] = None
 
@@ -236,7 +241,7 @@ class MLClusteringEngine:
     ) -> float:
         """Calculate distance between two feature vectors."""
         if metric == DistanceMetric.EUCLIDEAN:
-            return math.sqrt(sum((a - b) ** 2 for a, b in zip(v1, v2)))
+            return math.dist(v1, v2)
         elif metric == DistanceMetric.MANHATTAN:
             return sum(abs(a - b) for a, b in zip(v1, v2))
         elif metric == DistanceMetric.COSINE:
@@ -248,11 +253,22 @@ class MLClusteringEngine:
             return 1 - (dot / (norm1 * norm2))
         return 0.0
 
+    def _distance_function(self):
+        """Distance callable for the configured metric; Euclidean uses math.dist directly."""
+        if self.distance_metric == DistanceMetric.EUCLIDEAN:
+            return math.dist
+        metric = self.distance_metric
+        return lambda v1, v2: self._calculate_distance(v1, v2, metric)
+
     def _apply_weights(self, vector: List[float]) -> List[float]:
         """Apply feature weights to a vector."""
         weight_list = list(self.weights.values())
         return [v * w for v, w in zip(vector, weight_list)]
 
+    def _weighted_vectors(self, apps: List[ApplicationFeatures]) -> Dict[int, List[float]]:
+        """Weighted feature vectors keyed by id(app), so each is built once per pass."""
+        return {id(app): self._apply_weights(app.to_vector()) for app in apps}
+
     def _calculate_centroid(self, apps: List[ApplicationFeatures]) -> List[float]:
         """Calculate centroid of a group of applications."""
         if not apps:
@@ -274,9 +290,13 @@ class MLClusteringEngine:
         if len(self._applications) < k:
             k = len(self._applications)
 
+        # Weighted vectors don't change between iterations, so build them once
+        vectors = [self._apply_weights(app.to_vector()) for app in self._applications]
+        dist = self._distance_function()
+
         # Initialize centroids randomly
         indices = random.sample(range(len(self._applications)), k)
-        centroids = [self._apply_weights(self._applications[i].to_vector()) for i in indices]
+        centroids = [vectors[i] for i in indices]
 
         clusters: List[List[ApplicationFeatures]] = [[] for _ in range(k)]
 
@@ -285,12 +305,8 @@ class MLClusteringEngine:
             new_clusters: List[List[ApplicationFeatures]] = [[] for _ in range(k)]
 
             # Assign each application to nearest centroid
-            for app in self._applications:
-                weighted_vector = self._apply_weights(app.to_vector())
-                distances = [
-                    self._calculate_distance(weighted_vector, centroid)
-                    for centroid in centroids
-                ]
+            for app, weighted_vector in zip(self._applications, vectors):
+                distances = [dist(weighted_vector, centroid) for centroid in centroids]
                 nearest = distances.index(min(distances))
                 new_clusters[nearest].append(app)
 
@@ -327,17 +343,18 @@ class MLClusteringEngine:
             return 0.0
 
         silhouettes = []
+        vectors = self._weighted_vectors([app for cluster in clusters for app in cluster])
+        dist = self._distance_function()
 
         for i, cluster in enumerate(clusters):
             for app in cluster:
+                vector = vectors[id(app)]
+
                 # a(i) = average distance to other points in same cluster
                 if len(cluster) > 1:
                     a_i = sum(
-                        self._calculate_distance(
-                            self._apply_weights(app.to_vector()),
-                            self._apply_weights(other.to_vector())
-                        )
-                        for other in cluster if other != app
+                        dist(vector, vectors[id(other)])
+                        for other in cluster if other is not app
                     ) / (len(cluster) - 1)
                 else:
                     a_i = 0
@@ -347,10 +364,7 @@ class MLClusteringEngine:
                 for j, other_cluster in enumerate(clusters):
                     if i != j and other_cluster:
                         avg_dist = sum(
-                            self._calculate_distance(
-                                self._apply_weights(app.to_vector()),
-                                self._apply_weights(other.to_vector())
-                            )
+                            dist(vector, vectors[id(other)])
                             for other in other_cluster
                         ) / len(other_cluster)
                         b_i = min(b_i, avg_dist)
@@ -371,12 +385,13 @@ class MLClusteringEngine:
     def _calculate_inertia(self, clusters: List[List[ApplicationFeatures]]) -> float:
         """Calculate within-cluster sum of squares (inertia)."""
         inertia = 0.0
+        dist = self._distance_function()
         for cluster in clusters:
             if cluster:
                 centroid = self._apply_weights(self._calculate_centroid(cluster))
                 for app in cluster:
                     weighted_vector = self._apply_weights(app.to_vector())
-                    inertia += self._calculate_distance(weighted_vector, centroid) ** 2
+                    inertia += dist(weighted_vector, centroid) ** 2
         return inertia
 
     def find_optimal_k(self, max_k: int = 10) -> Tuple[int, List[float]]:
@@ -679,9 +694,12 @@ class MLClusteringEngine:
         return comparisons
 
 
-def create_clustering_engine(weights: Optional[Dict[str, float]] = None) -> MLClusteringEngine:
+def create_clustering_engine(
+    weights: Optional[Dict[str, float]] = None,
+    distance_metric: DistanceMetric = DistanceMetric.EUCLIDEAN
+) -> MLClusteringEngine:
     """Factory function to create a clustering engine."""
-    return MLClusteringEngine(feature_weights=weights)
+    return MLClusteringEngine(feature_weights=weights, distance_metric=distance_metric)
 
 
 def create_demo_applications(count: int = 30) -> List[ApplicationFeatures]:
@@ -287,12 +287,15 @@ class RecommendationEngine:
         """
         prioritized = {}
 
-        # Group by action
+        # Group by action in a single pass
+        by_action = {action.value: [] for action in ActionType}
+        for app in applications:
+            action_apps = by_action.get(app.get('recommendation', app.get('Action Recommendation')))
+            if action_apps is not None:
+                action_apps.append(app)
+
         for action in ActionType:
-            action_apps = [
-                app for app in applications
-                if app.get('recommendation', app.get('Action Recommendation')) == action.value
-            ]
+            action_apps = by_action[action.value]
 
             # Sort by composite score
             if action in [ActionType.RETIRE, ActionType.IMMEDIATE_ACTION]:
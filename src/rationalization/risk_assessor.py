@@ -67,6 +67,7 @@ class RiskAssessmentFramework:
         self.max_cost = max((app.get('cost', 0) for app in self.applications), default=1)
         self.risk_assessments = {}
         self.compliance_gaps = []
+        self._portfolio_assessment = None
 
     def assess_technical_risk(self, app: Dict) -> Dict[str, Any]:
         """Assess technical risk based on health, age, and complexity."""
@@ -378,7 +379,14 @@ class RiskAssessmentFramework:
             return 'low'
 
     def assess_portfolio(self) -> Dict[str, Any]:
-        """Assess risk for entire portfolio."""
+        """Assess risk for entire portfolio.
+
+        The applications are copied at construction, so the assessment is
+        computed once and returned again on later calls.
+        """
+        if self._portfolio_assessment is not None:
+            return self._portfolio_assessment
+
         assessments = []
 
         for app in self.applications:
@@ -412,7 +420,7 @@ class RiskAssessmentFramework:
         for assessment in assessments:
             priority_distribution[assessment['mitigation_priority']] += 1
 
-        return {
+        self._portfolio_assessment = {
             'assessments': assessments,
             'portfolio_metrics': {
                 'total_applications': len(assessments),
@@ -426,6 +434,7 @@ class RiskAssessmentFramework:
             'high_risk_apps': [a for a in assessments if a['risk_level'] in ['critical', 'high']],
             'urgent_apps': [a for a in assessments if a['mitigation_priority'] == 'urgent']
         }
+        return self._portfolio_assessment
 
     def check_compliance(self, framework: str = 'SOX') -> Dict[str, Any]:
         """Check compliance against specified framework."""
@@ -187,12 +187,16 @@ class ScoringEngine:
 
         for app in applications:
             try:
+                business_value = float(app.get('business_value', app.get('Business Value', 0)))
+                tech_health = float(app.get('tech_health', app.get('Tech Health', 0)))
+                security = float(app.get('security', app.get('Security', 0)))
+
                 composite = self.calculate_composite_score(
-                    business_value=float(app.get('business_value', app.get('Business Value', 0))),
-                    tech_health=float(app.get('tech_health', app.get('Tech Health', 0))),
+                    business_value=business_value,
+                    tech_health=tech_health,
                     cost=float(app.get('cost', app.get('Cost', 0))),
                     usage=float(app.get('usage', app.get('Usage', 0))),
-                    security=float(app.get('security', app.get('Security', 0))),
+                    security=security,
                     strategic_fit=float(app.get('strategic_fit', app.get('Strategic Fit', 0))),
                     redundancy=float(app.get('redundancy', app.get('Redundancy', 0)))
                 )
@@ -203,9 +207,9 @@ class ScoringEngine:
                 # Calculate retention score
                 retention = self.calculate_retention_score(
                     composite_score=composite,
-                    business_value=float(app.get('business_value', app.get('Business Value', 0))),
-                    tech_health=float(app.get('tech_health', app.get('Tech Health', 0))),
-                    security=float(app.get('security', app.get('Security', 0)))
+                    business_value=business_value,
+                    tech_health=tech_health,
+                    security=security
                 )
                 app_result['retention_score'] = retention
 
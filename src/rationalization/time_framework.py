@@ -141,6 +141,23 @@ class TIMEFramework:
         Returns:
             Tuple of (TIME_category, rationale_text)
         """
+        category, rationale, _, _ = self._categorize(
+            business_value, tech_health, security, strategic_fit, usage, cost, composite_score, redundancy
+        )
+        return category, rationale
+
+    def _categorize(
+        self,
+        business_value: float,
+        tech_health: float,
+        security: float,
+        strategic_fit: float,
+        usage: float,
+        cost: float,
+        composite_score: float,
+        redundancy: int
+    ) -> Tuple[str, str, float, float]:
+        """Categorize an application, also returning the BV and TQ scores it was based on."""
         # Calculate composite scores for the two TIME dimensions
         bv_score = self.calculate_business_value_score(
             business_value, usage, strategic_fit
@@ -182,7 +199,7 @@ class TIMEFramework:
         # Track statistics
         self.category_counts[category] += 1
 
-        return category, rationale
+        return category, rationale, bv_score, tq_score
 
     def _apply_time_logic(
         self,
@@ -283,7 +300,9 @@ class TIMEFramework:
 
         for app in applications:
             try:
-                category, rationale = self.categorize_application(
+                # The dimensional scores come back with the category rather than
+                # being recalculated for the result
+                category, rationale, bv_score, tq_score = self._categorize(
                     business_value=float(app.get('business_value', app.get('Business Value', 5))),
                     tech_health=float(app.get('tech_health', app.get('Tech Health', 5))),
                     security=float(app.get('security', app.get('Security', 5))),
@@ -297,20 +316,6 @@ class TIMEFramework:
                 app_result = app.copy()
                 app_result['time_category'] = category
                 app_result['time_rationale'] = rationale
-
-                # Calculate and include the dimensional scores
-                bv_score = self.calculate_business_value_score(
-                    float(app.get('business_value', app.get('Business Value', 5))),
-                    float(app.get('usage', app.get('Usage', 0))),
-                    float(app.get('strategic_fit', app.get('Strategic Fit', 5)))
-                )
-                tq_score = self.calculate_technical_quality_score(
-                    float(app.get('tech_health', app.get('Tech Health', 5))),
-                    float(app.get('security', app.get('Security', 5))),
-                    float(app.get('strategic_fit', app.get('Strategic Fit', 5))),
-                    float(app.get('cost', app.get('Cost', 0)))
-                )
-
                 app_result['time_bv_score'] = bv_score
                 app_result['time_tq_score'] = tq_score
 
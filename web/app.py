@@ -6,10 +6,37 @@ AI-powered application portfolio rationalization tool.
 
 import os
 import sys
+import gzip
 import json
+import hashlib
 import logging
-from datetime import datetime
-from flask import Flask, render_template, request, jsonify, session, Response, redirect
+import platform
+import sqlite3
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from decimal import Decimal
+from enum import Enum
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
+from datetime import datetime, date, timedelta
+from typing import NamedTuple
+from flask import (
+    Flask, render_template, request, jsonify, session, Response, redirect, abort,
+    stream_with_context
+)
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import bindparam, event, func, insert, lambda_stmt, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import load_only, raiseload, selectinload
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -27,7 +54,10 @@ from rationalization import (
     RiskAssessmentFramework, BenchmarkEngine,
     # Tier 2 engines
     DependencyMapper, IntegrationAssessor, VendorRiskEngine,
+    VendorProfile, VendorTier, VendorStatus, VendorComplianceFramework as VCF,
     create_demo_dependencies, create_demo_integrations, create_demo_vendors,
+    # Tier 2: Technical Debt
+    create_demo_tech_debt,
     # Tier 2: Lifecycle Management
     LifecycleManager, LifecycleStage, TransitionStatus, HealthStatus,
     SunsetReason, StageMetrics, create_lifecycle_manager, create_demo_lifecycles,
@@ -62,6 +92,10 @@ db_path = os.environ.get('DATABASE_URL', f'sqlite:///{os.path.join(basedir, ".."
 if db_path.startswith('postgres://'):
     db_path = db_path.replace('postgres://', 'postgresql://', 1)
 
+# psycopg2 is a CPython C extension; under PyPy use its cffi port instead
+if platform.python_implementation() == 'PyPy' and db_path.startswith('postgresql://'):
+    db_path = db_path.replace('postgresql://', 'postgresql+psycopg2cffi://', 1)
+
 # Ensure data directory exists for SQLite
 if db_path.startswith('sqlite'):
     data_dir = os.path.join(basedir, '..', 'data')
@@ -70,13 +104,87 @@ if db_path.startswith('sqlite'):
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-me')
 app.config['SQLALCHEMY_DATABASE_URI'] = db_path
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Room for every statement shape the routes issue in the compiled-SQL cache
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'query_cache_size': 1200}
+# A gevent worker runs many requests at once, so give it more than the default 5+10
+# connections (SQLite does not pool this way)
+if not db_path.startswith('sqlite'):
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'].update(
+        pool_size=int(os.environ.get('DB_POOL_SIZE', 20)),
+        max_overflow=int(os.environ.get('DB_MAX_OVERFLOW', 20))
+    )
+# psycopg2 batches executemany INSERTs by default but sends executemany UPDATEs
+# (the bulk score writes) one row per round trip; page those as well
+if db_path.startswith(('postgresql://', 'postgresql+psycopg2://', 'postgresql+psycopg2cffi://')):
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'].update(
+        executemany_mode='values_plus_batch',
+        executemany_batch_page_size=1000
+    )
+
+# gzip JSON responses in-app; set COMPRESS_RESPONSES=false behind a compressing proxy
+app.config['COMPRESS_RESPONSES'] = os.environ.get('COMPRESS_RESPONSES', 'true').lower() != 'false'
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_LEVEL'] = 4
+
+# SQLite file databases already get a QueuePool from SQLAlchemy 2.0; each new
+# pooled connection switches to WAL so dashboard reads do not wait on an analysis
+# writing, and relaxes fsyncs to once per checkpoint
+if db_path.startswith('sqlite'):
+    # Page cache size in KiB. SQLite keeps one cache per connection, so the
+    # worst case is this times the pool size plus overflow (about 240 MB for
+    # the default 5 + 10 at 16 MB).
+    SQLITE_CACHE_KB = int(os.environ.get('SQLITE_CACHE_KB', 16000))
+
+    @event.listens_for(Engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        if isinstance(dbapi_connection, sqlite3.Connection):
+            cursor = dbapi_connection.cursor()
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.execute('PRAGMA temp_store=MEMORY')
+            cursor.execute(f'PRAGMA cache_size=-{SQLITE_CACHE_KB}')
+            cursor.close()
+
+# Make unplanned relationship lazy loads raise instead of querying, so a new N+1
+# pattern fails loudly; meant for development and test runs
+app.config['SQLALCHEMY_RAISELOAD'] = os.environ.get('SQLALCHEMY_RAISELOAD', 'false').lower() == 'true'
 
 # Initialize extensions
 db.init_app(app)
 
+
+@event.listens_for(db.session, 'do_orm_execute')
+def _raiseload_by_default(orm_execute_state):
+    """Add raiseload('*') to top-level ORM SELECTs when SQLALCHEMY_RAISELOAD is set.
+
+    Loader options a query names itself (selectinload etc.) still take effect;
+    only relationships it did not plan for raise on access.
+    """
+    if (app.config['SQLALCHEMY_RAISELOAD']
+            and orm_execute_state.is_select
+            and not orm_execute_state.is_column_load
+            and not orm_execute_state.is_relationship_load):
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload('*'))
+
+def ensure_indexes():
+    """Create declared indexes that an existing database is missing.
+
+    ``create_all`` skips tables that already exist, so an index added to
+    ``__table_args__`` later never reaches a deployed database on its own.
+    Safe to run on every start: each index is checked before it is created.
+    """
+    with db.engine.begin() as conn:
+        # Superseded by ix_compliance_result_portfolio_framework_pct
+        conn.execute(db.text('DROP INDEX IF EXISTS ix_compliance_result_portfolio_framework'))
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
+
 # Create tables
 with app.app_context():
     db.create_all()
+    ensure_indexes()
 
 # Initialize engines
 rationalization_engine = RationalizationEngine()
@@ -86,14 +194,172 @@ rationalization_engine = RationalizationEngine()
 # TEMPLATE CONTEXT
 # =============================================================================
 
+# Template globals are rebuilt only once the year they were built in is over
+_template_globals = {}
+_template_globals_expire = 0.0
+
+
 @app.context_processor
 def inject_globals():
     """Inject global variables into all templates."""
-    return {
-        'app_name': 'App Rationalization Pro',
-        'company_name': 'Patriot Tech Systems',
-        'current_year': datetime.now().year
-    }
+    global _template_globals, _template_globals_expire
+    if time.time() >= _template_globals_expire:
+        year = datetime.now().year
+        _template_globals = {
+            'app_name': 'App Rationalization Pro',
+            'company_name': 'Patriot Tech Systems',
+            'current_year': year
+        }
+        _template_globals_expire = datetime(year + 1, 1, 1).timestamp()
+    return _template_globals
+
+
+# =============================================================================
+# JSON HELPERS
+# =============================================================================
+
+def _json_default(obj):
+    """Encode the types the JSON encoders don't handle on their own."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_json_default).encode('utf-8')
+
+
+def conditional_json(body: bytes) -> Response:
+    """Encoded JSON response with an ETag; answers a matching If-None-Match with 304."""
+    response = Response(body, mimetype='application/json')
+    response.set_etag(hashlib.blake2b(body, digest_size=8).hexdigest())
+    return response.make_conditional(request)
+
+
+class StaticJSON(NamedTuple):
+    """Reference data encoded once: the JSON bytes, their ETag and a gzipped copy."""
+    body: bytes
+    etag: str
+    gzipped: bytes
+
+    @classmethod
+    def encode(cls, obj) -> 'StaticJSON':
+        body = json_dumps(obj)
+        return cls(body, hashlib.blake2b(body, digest_size=8).hexdigest(), gzip.compress(body, compresslevel=9))
+
+
+def static_json_response(static: StaticJSON, max_age: int) -> Response:
+    """Publicly cacheable response for a StaticJSON, with no per-request encoding.
+
+    Clients that accept gzip get the precompressed bytes (the compression hook
+    leaves responses that already have a Content-Encoding alone).
+    """
+    response = Response(static.body, mimetype='application/json')
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    response.vary.add('Accept-Encoding')
+    if (app.config['COMPRESS_RESPONSES'] and len(static.body) >= app.config['COMPRESS_MIN_SIZE']
+            and 'gzip' in request.accept_encodings):
+        response.set_data(static.gzipped)
+        response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(static.etag, weak=True)
+    else:
+        response.set_etag(static.etag)
+    return response.make_conditional(request)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that routes jsonify() and request parsing through orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return json_dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(json_dumps(obj), mimetype=self.mimetype)
+
+
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+
+
+def stream_json_list(items):
+    """Yield a JSON array piece by piece so large lists are never fully buffered."""
+    yield b'['
+    for i, item in enumerate(items):
+        if i:
+            yield b','
+        yield json_dumps(item)
+    yield b']'
+
+
+# Payloads covering more applications than this are streamed, smaller ones sent in one buffer
+STREAM_MIN_ITEMS = 200
+
+# Portfolios with at least this many applications are analyzed as background jobs.
+# Off (0) by default: jobs are only visible to the process that started them, so
+# enable it only when a single web worker serves every request.
+BACKGROUND_ANALYSIS_MIN_APPS = int(os.environ.get('BACKGROUND_ANALYSIS_MIN_APPS', 0))
+
+
+def run_in_background(app_count: int, data: dict) -> bool:
+    """Whether an analysis request should run as a job rather than inline."""
+    return bool(data.get('background')) or 0 < BACKGROUND_ANALYSIS_MIN_APPS <= app_count
+
+
+def stream_json(obj: dict, array_key: str = None, rows=()):
+    """Yield a JSON object one top-level key at a time, then ``rows`` under ``array_key``."""
+    yield b'{'
+    for i, (key, value) in enumerate(obj.items()):
+        if i:
+            yield b','
+        yield json_dumps(key) + b':' + json_dumps(value)
+    if array_key is not None:
+        if obj:
+            yield b','
+        yield json_dumps(array_key) + b':'
+        yield from stream_json_list(rows)
+    yield b'}'
+
+
+# =============================================================================
+# RESPONSE COMPRESSION
+# =============================================================================
+
+@app.after_request
+def compress_json_response(response):
+    """gzip buffered JSON responses larger than COMPRESS_MIN_SIZE for clients that accept it."""
+    if (not app.config['COMPRESS_RESPONSES']
+            or response.mimetype != 'application/json'
+            or response.status_code != 200
+            or response.direct_passthrough
+            or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in request.accept_encodings):
+        return response
+
+    body = response.get_data()
+    if len(body) < app.config['COMPRESS_MIN_SIZE']:
+        return response
+
+    response.set_data(gzip.compress(body, compresslevel=app.config['COMPRESS_LEVEL']))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    # The compressed bytes differ from the identity encoding, so the validator becomes weak
+    etag, _ = response.get_etag()
+    if etag:
+        response.set_etag(etag, weak=True)
+    return response
 
 
 # =============================================================================
@@ -145,23 +411,60 @@ def chat_page():
     portfolio_id = request.args.get('portfolio_id')
     portfolio = None
     if portfolio_id:
-        portfolio = Portfolio.query.get(portfolio_id)
+        portfolio = db.session.get(Portfolio, portfolio_id)
     return render_template('chat.html', portfolio=portfolio)
 
 
+def portfolio_with_applications_or_404(portfolio_id: str) -> Portfolio:
+    """Load a portfolio with its applications batched into one follow-up SELECT, or 404."""
+    portfolio = db.session.execute(
+        select(Portfolio).options(selectinload(Portfolio.applications)).where(Portfolio.id == portfolio_id)
+    ).scalar_one_or_none()
+    if portfolio is None:
+        abort(404)
+    return portfolio
+
+
+# Application columns read by the cost modeler and the compliance engine
+COST_MODEL_FIELDS = ('id', 'name', 'category', 'cost', 'tech_health', 'business_value')
+COMPLIANCE_FIELDS = ('id', 'name', 'security', 'tech_health')
+
+
+def application_dicts(portfolio_id: str, fields: tuple) -> list:
+    """Read a portfolio's applications as dicts of the raw ``fields`` columns.
+
+    Only the selected columns are fetched, in batches, and no ORM objects are
+    built; nothing is pending in a read, so the session's autoflush check is
+    skipped.
+    """
+    stmt = (select(*(getattr(Application, field) for field in dict.fromkeys(fields)))
+            .where(Application.portfolio_id == portfolio_id)
+            .execution_options(yield_per=500))
+    with db.session.no_autoflush:
+        return [row._asdict() for row in db.session.execute(stmt)]
+
+
+# Built once; only the portfolio ID bind parameter changes between requests
+APPS_BY_SCORE_STMT = lambda_stmt(
+    lambda: select(Application)
+    .where(Application.portfolio_id == bindparam('pid'))
+    .order_by(Application.composite_score.desc().nulls_last())
+)
+
+
 @app.route('/portfolio/<portfolio_id>')
 def portfolio_detail(portfolio_id):
     """Portfolio detail view with all applications."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.order_by(Application.composite_score.desc()).all()
+    portfolio = db.get_or_404(Portfolio, portfolio_id)
+    applications = db.session.execute(APPS_BY_SCORE_STMT, {'pid': portfolio_id}).scalars().all()
     return render_template('portfolio.html', portfolio=portfolio, applications=applications)
 
 
 @app.route('/results/<portfolio_id>')
 def results_page(portfolio_id):
     """Rationalization results view."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    portfolio = portfolio_with_applications_or_404(portfolio_id)
+    applications = portfolio.applications
     return render_template('results.html', portfolio=portfolio, applications=applications)
 
 
@@ -172,8 +475,11 @@ def results_page(portfolio_id):
 @app.route('/api/portfolios', methods=['GET'])
 def get_portfolios():
     """Get all portfolios."""
-    portfolios = Portfolio.query.order_by(Portfolio.updated_at.desc()).all()
-    return jsonify([p.to_dict() for p in portfolios])
+    rows = db.session.execute(
+        select(*(getattr(Portfolio, column) for column in Portfolio.DICT_COLUMNS))
+        .order_by(Portfolio.updated_at.desc())
+    )
+    return jsonify([Portfolio.dict_from_row(row) for row in rows])
 
 
 @app.route('/api/portfolios', methods=['POST'])
@@ -196,14 +502,14 @@ def create_portfolio():
 @app.route('/api/portfolios/<portfolio_id>', methods=['GET'])
 def get_portfolio(portfolio_id):
     """Get a specific portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    portfolio = db.get_or_404(Portfolio, portfolio_id)
     return jsonify(portfolio.to_dict())
 
 
 @app.route('/api/portfolios/<portfolio_id>', methods=['DELETE'])
 def delete_portfolio(portfolio_id):
     """Delete a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    portfolio = db.get_or_404(Portfolio, portfolio_id)
     db.session.delete(portfolio)
     db.session.commit()
     return jsonify({'success': True})
@@ -216,15 +522,24 @@ def delete_portfolio(portfolio_id):
 @app.route('/api/portfolios/<portfolio_id>/applications', methods=['GET'])
 def get_applications(portfolio_id):
     """Get all applications in a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
-    return jsonify([a.to_dict() for a in applications])
+    # Serialize plain column rows; no ORM instances are built for a read-only
+    # listing. Only an empty result needs the portfolio existence check.
+    rows = db.session.execute(
+        select(*(getattr(Application, field) for field in Application.DICT_FIELDS))
+        .where(Application.portfolio_id == portfolio_id)
+    ).all()
+    if not rows:
+        _require_portfolio(portfolio_id)
+    if len(rows) > STREAM_MIN_ITEMS:
+        return Response(stream_with_context(stream_json_list(map(Application.dict_from_row, rows))),
+                        mimetype='application/json')
+    return jsonify([Application.dict_from_row(row) for row in rows])
 
 
 @app.route('/api/portfolios/<portfolio_id>/applications', methods=['POST'])
 def create_application(portfolio_id):
     """Create a new application in a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    portfolio = db.get_or_404(Portfolio, portfolio_id)
     data = request.get_json()
 
     app_data = Application(
@@ -259,9 +574,9 @@ def create_application(portfolio_id):
     app_data.apply_scoring_results(results)
 
     db.session.add(app_data)
-    db.session.commit()
 
-    # Update portfolio metrics
+    # Update portfolio metrics (the metrics query autoflushes the new row) and
+    # commit both together
     portfolio.update_metrics()
     db.session.commit()
 
@@ -271,14 +586,14 @@ def create_application(portfolio_id):
 @app.route('/api/applications/<app_id>', methods=['GET'])
 def get_application(app_id):
     """Get a specific application."""
-    application = Application.query.get_or_404(app_id)
+    application = db.get_or_404(Application, app_id)
     return jsonify(application.to_dict())
 
 
 @app.route('/api/applications/<app_id>', methods=['PUT'])
 def update_application(app_id):
     """Update an application."""
-    application = Application.query.get_or_404(app_id)
+    application = db.get_or_404(Application, app_id)
     data = request.get_json()
 
     # Update fields
@@ -298,10 +613,8 @@ def update_application(app_id):
     results = rationalization_engine.process_single_application(application.to_scoring_dict())
     application.apply_scoring_results(results)
 
-    db.session.commit()
-
-    # Update portfolio metrics
-    application.portfolio.update_metrics()
+    # Update portfolio metrics in the same transaction
+    db.session.get(Portfolio, application.portfolio_id).update_metrics()
     db.session.commit()
 
     return jsonify(application.to_dict())
@@ -310,13 +623,12 @@ def update_application(app_id):
 @app.route('/api/applications/<app_id>', methods=['DELETE'])
 def delete_application(app_id):
     """Delete an application."""
-    application = Application.query.get_or_404(app_id)
-    portfolio = application.portfolio
+    application = db.get_or_404(Application, app_id)
+    portfolio = db.session.get(Portfolio, application.portfolio_id)
 
     db.session.delete(application)
-    db.session.commit()
 
-    # Update portfolio metrics
+    # Update portfolio metrics in the same transaction
     portfolio.update_metrics()
     db.session.commit()
 
@@ -329,35 +641,54 @@ def delete_application(app_id):
 
 @app.route('/api/portfolios/<portfolio_id>/analyze', methods=['POST'])
 def analyze_portfolio(portfolio_id):
-    """Run rationalization analysis on all applications in a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    """Run rationalization analysis on all applications in a portfolio.
 
-    if not applications:
+    Pass ``"background": true`` (or set BACKGROUND_ANALYSIS_MIN_APPS) to run it
+    as a job; see /api/jobs/<job_id>.
+    """
+    _require_portfolio(portfolio_id)
+    app_dicts = application_dicts(portfolio_id, ('id',) + Application.SCORING_INPUT_FIELDS)
+
+    if not app_dicts:
         return jsonify({'error': 'No applications to analyze'}), 400
 
-    # Reset engine counters
-    rationalization_engine.reset()
+    app_ids = [app.pop('id') for app in app_dicts]
 
-    # Process all applications
-    app_dicts = [app.to_scoring_dict() for app in applications]
-    results = rationalization_engine.process_portfolio(app_dicts)
+    data = request.get_json(silent=True) or {}
+    if run_in_background(len(app_dicts), data):
+        return submit_saved_analysis_job(score_portfolio, (app_dicts,),
+                                         save_portfolio_analysis, portfolio_id, app_ids)
 
-    # Apply results back to database
-    for app, result in zip(applications, results['applications']):
-        app.apply_scoring_results(result)
+    return jsonify(save_portfolio_analysis(score_portfolio(app_dicts), portfolio_id, app_ids))
 
-    db.session.commit()
 
-    # Update portfolio metrics
-    portfolio.update_metrics()
+def score_portfolio(app_dicts: list) -> dict:
+    """Score scoring dicts on a fresh engine.
+
+    The engine's counters feed the summary, so a job never touches the shared
+    rationalization_engine that request handlers score single applications on.
+    """
+    return RationalizationEngine().process_portfolio(app_dicts)
+
+
+def save_portfolio_analysis(results: dict, portfolio_id: str, app_ids: list) -> dict:
+    """Write scores for ``app_ids`` and the portfolio metrics, then commit once."""
+    # One bulk UPDATE by primary key, with the portfolio metrics taken from the
+    # results rather than re-read from the rows
+    db.session.execute(update(Application), [
+        {'id': app_id, **{field: result.get(field) for field in Application.SCORING_RESULT_FIELDS}}
+        for app_id, result in zip(app_ids, results['applications'])
+    ])
+    portfolio = db.session.get(Portfolio, portfolio_id)
+    portfolio.apply_metrics([(r.get('cost'), r.get('composite_score'), r.get('time_category'))
+                             for r in results['applications']])
     db.session.commit()
 
-    return jsonify({
+    return {
         'success': True,
         'summary': results['summary'],
         'portfolio': portfolio.to_dict()
-    })
+    }
 
 
 # =============================================================================
@@ -367,7 +698,7 @@ def analyze_portfolio(portfolio_id):
 @app.route('/api/portfolios/<portfolio_id>/cost-analysis', methods=['GET'])
 def get_cost_analysis(portfolio_id):
     """Get the latest cost analysis for a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    _require_portfolio(portfolio_id)
 
     # Get latest analysis
     analysis = CostAnalysis.query.filter_by(portfolio_id=portfolio_id).order_by(
@@ -381,24 +712,35 @@ def get_cost_analysis(portfolio_id):
 
 @app.route('/api/portfolios/<portfolio_id>/cost-analysis', methods=['POST'])
 def run_cost_analysis(portfolio_id):
-    """Run cost analysis on a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    """Run cost analysis on a portfolio.
 
-    if not applications:
+    Pass ``"background": true`` (or set BACKGROUND_ANALYSIS_MIN_APPS) to run it
+    as a job; see /api/jobs/<job_id>.
+    """
+    _require_portfolio(portfolio_id)
+    app_dicts = application_dicts(portfolio_id, COST_MODEL_FIELDS)
+
+    if not app_dicts:
         return jsonify({'error': 'No applications to analyze'}), 400
 
-    # Convert to list of dicts for cost modeler
-    app_dicts = [app.to_dict() for app in applications]
+    data = request.get_json(silent=True) or {}
+    if run_in_background(len(app_dicts), data):
+        return submit_saved_analysis_job(model_costs, (app_dicts,), save_cost_analysis, portfolio_id)
+
+    return jsonify(save_cost_analysis(model_costs(app_dicts), portfolio_id))
 
-    # Run cost analysis
+
+def model_costs(app_dicts: list) -> tuple:
+    """Run the cost modeler, returning (tco_summary, optimization_summary)."""
     cost_modeler = CostModeler(app_dicts)
     tco_summary = cost_modeler.calculate_tco_breakdown()
     cost_modeler.identify_hidden_costs()
-    optimization = cost_modeler.get_cost_optimization_summary()
+    return tco_summary, cost_modeler.get_cost_optimization_summary()
+
 
-    # Save to database
-    analysis = CostAnalysis(
+def cost_analysis_record(portfolio_id: str, tco_summary: dict, optimization: dict) -> CostAnalysis:
+    """Build the CostAnalysis row for a model_costs() result."""
+    return CostAnalysis(
         portfolio_id=portfolio_id,
         total_portfolio_cost=optimization['current_portfolio_cost'],
         hidden_costs_total=optimization['hidden_costs_total'],
@@ -411,21 +753,26 @@ def run_cost_analysis(portfolio_id):
         top_opportunities=optimization['top_opportunities']
     )
 
+
+def save_cost_analysis(results: tuple, portfolio_id: str) -> dict:
+    """Store a model_costs() result for the portfolio."""
+    tco_summary, optimization = results
+    analysis = cost_analysis_record(portfolio_id, tco_summary, optimization)
     db.session.add(analysis)
     db.session.commit()
 
-    return jsonify({
+    return {
         'success': True,
         'analysis': analysis.to_dict(),
         'tco_summary': tco_summary
-    })
+    }
 
 
 @app.route('/costs/<portfolio_id>')
 def costs_page(portfolio_id):
     """Cost analysis page."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    portfolio = portfolio_with_applications_or_404(portfolio_id)
+    applications = portfolio.applications
 
     # Get latest analysis if exists
     analysis = CostAnalysis.query.filter_by(portfolio_id=portfolio_id).order_by(
@@ -442,168 +789,273 @@ def costs_page(portfolio_id):
 # COMPLIANCE ENGINE API
 # =============================================================================
 
+@lru_cache(maxsize=1)
+def get_compliance_engine() -> ComplianceEngine:
+    """Get the shared compliance engine.
+
+    Building the framework catalog is the only work in ComplianceEngine();
+    assessments never modify it, so one instance serves every request.
+    """
+    return ComplianceEngine()
+
+
+def compliance_result_rows(portfolio_id: str, framework_name: str, assessments: list) -> list:
+    """Map engine assessments to ComplianceResult rows for a bulk insert."""
+    return [
+        {
+            'application_id': assessment.get('application_id'),
+            'portfolio_id': portfolio_id,
+            'framework': framework_name,
+            'compliance_percentage': assessment['compliance_percentage'],
+            'compliance_level': assessment['compliance_level'],
+            'risk_level': assessment['risk_level'],
+            'total_requirements': assessment['total_requirements'],
+            'compliant_count': assessment['compliant_count'],
+            'partial_count': assessment['partial_count'],
+            'non_compliant_count': assessment['non_compliant_count'],
+            'critical_gaps_count': assessment['critical_gaps_count'],
+            'requirement_results': assessment['requirement_results'],
+            'gaps': assessment['gaps'],
+            'critical_gaps': assessment['critical_gaps']
+        }
+        for assessment in assessments
+    ]
+
+
+# The framework catalog only changes with a deploy, so both endpoints encode (and
+# compress) their body once and let clients cache it for a day; the ETag makes
+# revalidation after that a 304
+FRAMEWORK_CACHE_MAX_AGE = 86400
+
+
+@lru_cache(maxsize=1)
+def compliance_frameworks_json() -> StaticJSON:
+    return StaticJSON.encode(compliance_frameworks())
+
+
+@lru_cache(maxsize=64)
+def compliance_framework_json(framework_name: str) -> StaticJSON:
+    return StaticJSON.encode(get_compliance_engine().get_framework_summary(framework_name))
+
+
 @app.route('/api/compliance/frameworks', methods=['GET'])
 def get_frameworks():
     """Get list of available compliance frameworks."""
-    engine = ComplianceEngine()
-    return jsonify(engine.list_frameworks())
+    return static_json_response(compliance_frameworks_json(), FRAMEWORK_CACHE_MAX_AGE)
 
 
 @app.route('/api/compliance/frameworks/<framework_name>', methods=['GET'])
 def get_framework_details(framework_name):
     """Get details of a specific compliance framework."""
-    engine = ComplianceEngine()
-    summary = engine.get_framework_summary(framework_name)
-    if 'error' in summary:
-        return jsonify(summary), 404
-    return jsonify(summary)
+    if framework_name not in get_compliance_engine().frameworks:
+        return jsonify({'error': f'Framework {framework_name} not found'}), 404
+    return static_json_response(compliance_framework_json(framework_name), FRAMEWORK_CACHE_MAX_AGE)
 
 
 @app.route('/api/portfolios/<portfolio_id>/compliance/<framework_name>', methods=['GET'])
 def get_compliance_results(portfolio_id, framework_name):
     """Get compliance assessment results for a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-
-    # Get all compliance results for this framework
-    results = ComplianceResult.query.filter_by(
-        portfolio_id=portfolio_id,
-        framework=framework_name
-    ).all()
+    _require_portfolio(portfolio_id)
+
+    # Fetch results in batches; only the first STREAM_MIN_ITEMS + 1 are buffered
+    # to decide between one response body and a stream
+    results = db.session.scalars(
+        select(ComplianceResult)
+        .where(ComplianceResult.portfolio_id == portfolio_id, ComplianceResult.framework == framework_name)
+        .execution_options(yield_per=STREAM_MIN_ITEMS)
+    )
+    head = list(islice(results, STREAM_MIN_ITEMS + 1))
 
-    if not results:
+    if not head:
         return jsonify({'error': 'No compliance assessment found. Run assessment first.'}), 404
 
-    return jsonify({
-        'framework': framework_name,
-        'portfolio_id': portfolio_id,
-        'assessments': [r.to_dict() for r in results]
-    })
+    header = {'framework': framework_name, 'portfolio_id': portfolio_id}
+    if len(head) > STREAM_MIN_ITEMS:
+        return Response(stream_with_context(stream_json(
+            header, 'assessments', map(ComplianceResult.to_dict, chain(head, results))
+        )), mimetype='application/json')
+    return jsonify({**header, 'assessments': [r.to_dict() for r in head]})
 
 
 @app.route('/api/portfolios/<portfolio_id>/compliance/<framework_name>', methods=['POST'])
 def run_compliance_assessment(portfolio_id, framework_name):
-    """Run compliance assessment on a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    """Run compliance assessment on a portfolio.
 
-    if not applications:
+    Pass ``"background": true`` (or set BACKGROUND_ANALYSIS_MIN_APPS) to run it
+    as a job; see /api/jobs/<job_id>.
+    """
+    _require_portfolio(portfolio_id)
+    app_dicts = application_dicts(portfolio_id, COMPLIANCE_FIELDS)
+
+    if not app_dicts:
         return jsonify({'error': 'No applications to assess'}), 400
 
-    # Convert to list of dicts
-    app_dicts = [app.to_dict() for app in applications]
+    if framework_name not in get_compliance_engine().frameworks:
+        return jsonify({'error': f'Framework {framework_name} not found'}), 400
+
+    data = request.get_json(silent=True) or {}
+    if run_in_background(len(app_dicts), data):
+        return submit_saved_analysis_job(assess_compliance, (app_dicts, framework_name),
+                                         save_compliance_assessment, portfolio_id, framework_name)
+
+    results = assess_compliance(app_dicts, framework_name)
+    return jsonify(save_compliance_assessment(results, portfolio_id, framework_name))
 
-    # Run compliance assessment
-    engine = ComplianceEngine()
-    results = engine.batch_assess(app_dicts, framework_name)
 
-    if 'error' in results:
-        return jsonify(results), 400
+def assess_compliance(app_dicts: list, framework_name: str) -> dict:
+    """Assess compliance dicts against a framework known to the engine."""
+    return get_compliance_engine().batch_assess(app_dicts, framework_name)
 
-    # Clear old results for this framework
+
+def save_compliance_assessment(results: dict, portfolio_id: str, framework_name: str) -> dict:
+    """Replace the portfolio's stored results for the framework with ``results``."""
+    # Replace old results for this framework in one transaction: a bulk DELETE and
+    # a single executemany INSERT, with no ORM instances in between
     ComplianceResult.query.filter_by(
         portfolio_id=portfolio_id,
         framework=framework_name
-    ).delete()
+    ).delete(synchronize_session=False)
 
-    # Save individual application results
-    for assessment in results['application_assessments']:
-        result = ComplianceResult(
-            application_id=assessment.get('application_id'),
-            portfolio_id=portfolio_id,
-            framework=framework_name,
-            compliance_percentage=assessment['compliance_percentage'],
-            compliance_level=assessment['compliance_level'],
-            risk_level=assessment['risk_level'],
-            total_requirements=assessment['total_requirements'],
-            compliant_count=assessment['compliant_count'],
-            partial_count=assessment['partial_count'],
-            non_compliant_count=assessment['non_compliant_count'],
-            critical_gaps_count=assessment['critical_gaps_count'],
-            requirement_results=assessment['requirement_results'],
-            gaps=assessment['gaps'],
-            critical_gaps=assessment['critical_gaps']
-        )
-        db.session.add(result)
+    rows = compliance_result_rows(portfolio_id, framework_name, results['application_assessments'])
+    if rows:
+        db.session.execute(insert(ComplianceResult), rows)
 
     db.session.commit()
 
-    return jsonify({
+    return {
         'success': True,
         'framework': framework_name,
         'portfolio_summary': results['portfolio_summary'],
         'risk_distribution': results['risk_distribution'],
         'remediation_priorities': results['remediation_priorities']
-    })
+    }
 
 
 @app.route('/compliance/<portfolio_id>')
 def compliance_page(portfolio_id):
     """Compliance assessment page."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    portfolio = db.get_or_404(Portfolio, portfolio_id)
+
+    return render_template('compliance.html',
+                          portfolio=portfolio,
+                          frameworks=compliance_frameworks(),
+                          compliance_data=compliance_page_data(portfolio_id))
+
+
+@lru_cache(maxsize=1)
+def compliance_frameworks() -> list:
+    """Framework summaries from the shared engine; the catalog never changes."""
+    return get_compliance_engine().list_frameworks()
+
+
+COMPLIANCE_PAGE_COLUMNS = (
+    ComplianceResult.framework,
+    ComplianceResult.application_id,
+    ComplianceResult.compliance_percentage,
+    ComplianceResult.compliance_level,
+    ComplianceResult.risk_level,
+    ComplianceResult.compliant_count,
+    ComplianceResult.partial_count,
+    ComplianceResult.non_compliant_count,
+    ComplianceResult.critical_gaps_count,
+    Application.name.label('application_name'),
+)
 
-    # Get all compliance results
-    engine = ComplianceEngine()
-    frameworks = engine.list_frameworks()
 
-    # Build app name lookup for display
-    app_names = {str(a.id): a.name for a in applications}
+def compliance_page_data(portfolio_id: str) -> dict:
+    """Per-framework assessments and averages for the compliance page.
+
+    Assessments are replaced wholesale on every run, so the result count and
+    latest assessed_at (plus the latest application edit, for display names)
+    identify a portfolio's compliance state; the grouped data is cached on it.
+    """
+    version = db.session.execute(
+        select(
+            select(func.count(), func.max(ComplianceResult.assessed_at))
+            .where(ComplianceResult.portfolio_id == portfolio_id)
+            .subquery()
+        ).add_columns(
+            select(func.max(Application.updated_at))
+            .where(Application.portfolio_id == portfolio_id)
+            .scalar_subquery()
+        )
+    ).one()
+    return _compliance_page_data(portfolio_id, tuple(version))
+
+
+@lru_cache(maxsize=128)
+def _compliance_page_data(portfolio_id: str, version: tuple) -> dict:
+    rows = db.session.execute(
+        select(*COMPLIANCE_PAGE_COLUMNS)
+        .outerjoin(Application, Application.id == ComplianceResult.application_id)
+        .where(ComplianceResult.portfolio_id == portfolio_id)
+    ).mappings()
+
+    by_framework = {}
+    for row in rows:
+        assessment = dict(row)
+        if assessment['application_name'] is None:
+            assessment['application_name'] = assessment['application_id']
+        by_framework.setdefault(assessment['framework'], []).append(assessment)
+
+    averages = dict(db.session.execute(
+        select(ComplianceResult.framework, func.avg(ComplianceResult.compliance_percentage))
+        .where(ComplianceResult.portfolio_id == portfolio_id)
+        .group_by(ComplianceResult.framework)
+    ).all())
 
     compliance_data = {}
-    for fw in frameworks:
-        fw_name = fw['name']
-        results = ComplianceResult.query.filter_by(
-            portfolio_id=portfolio_id,
-            framework=fw_name
-        ).all()
-        if results:
-            assessments = []
-            for r in results:
-                d = r.to_dict()
-                d['application_name'] = app_names.get(r.application_id, r.application_id)
-                assessments.append(d)
-            compliance_data[fw_name] = {
+    for fw in compliance_frameworks():
+        assessments = by_framework.get(fw['name'])
+        if assessments:
+            compliance_data[fw['name']] = {
                 'assessments': assessments,
-                'avg_compliance': sum(r.compliance_percentage for r in results) / len(results) if results else 0
+                'avg_compliance': averages.get(fw['name']) or 0
             }
-
-    return render_template('compliance.html',
-                          portfolio=portfolio,
-                          applications=applications,
-                          frameworks=frameworks,
-                          compliance_data=compliance_data)
+    return compliance_data
 
 
 # =============================================================================
 # WHAT-IF SCENARIO API
 # =============================================================================
 
-def _apps_to_whatif_format(applications):
-    """Convert application objects to What-If engine format."""
-    return [
-        {
-            'name': app.name,
-            'cost': app.cost or 0,
-            'tech_health': app.tech_health or 5,
-            'business_value': app.business_value or 5,
-            'security': app.security or 5,
-            'redundancy': app.redundancy or 0,
-            'category': app.category or 'Other'
-        }
-        for app in applications
-    ]
+# Engine input columns, with the per-field fallbacks applied by the database. Each
+# engine selects only the fields it reads, straight from the applications table.
+ENGINE_APP_COLUMNS = {
+    'name': Application.name,
+    'cost': func.coalesce(Application.cost, 0).label('cost'),
+    'tech_health': func.coalesce(func.nullif(Application.tech_health, 0), 5).label('tech_health'),
+    'business_value': func.coalesce(func.nullif(Application.business_value, 0), 5).label('business_value'),
+    'security': func.coalesce(func.nullif(Application.security, 0), 5).label('security'),
+    'redundancy': func.coalesce(Application.redundancy, 0).label('redundancy'),
+    'category': func.coalesce(func.nullif(Application.category, ''), 'Other').label('category'),
+    'description': func.coalesce(Application.description, '').label('description')
+}
+
+WHATIF_FIELDS = ('name', 'cost', 'tech_health', 'business_value', 'security', 'redundancy', 'category')
+ROADMAP_FIELDS = ('name', 'cost', 'tech_health', 'business_value', 'category', 'description')
+RISK_FIELDS = ('name', 'cost', 'tech_health', 'business_value', 'security', 'category', 'description')
+BENCHMARK_FIELDS = ('name', 'cost', 'tech_health', 'business_value', 'category')
+
+
+def engine_app_dicts(portfolio_id: str, fields: tuple) -> list:
+    """Load a portfolio's applications as engine input dicts holding just ``fields``."""
+    stmt = select(*(ENGINE_APP_COLUMNS[field] for field in fields)).where(
+        Application.portfolio_id == portfolio_id
+    )
+    with db.session.no_autoflush:
+        return [row._asdict() for row in db.session.execute(stmt)]
 
 
 @app.route('/api/portfolios/<portfolio_id>/whatif/scenarios', methods=['GET'])
 def get_recommended_scenarios(portfolio_id):
     """Get recommended What-If scenarios for a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    _require_portfolio(portfolio_id)
+    app_dicts = engine_app_dicts(portfolio_id, WHATIF_FIELDS)
 
-    if not applications:
+    if not app_dicts:
         return jsonify({'error': 'No applications to analyze'}), 400
 
-    app_dicts = _apps_to_whatif_format(applications)
     engine = WhatIfScenarioEngine(app_dicts)
     recommendations = engine.get_recommended_scenarios()
 
@@ -617,14 +1069,13 @@ def get_recommended_scenarios(portfolio_id):
 @app.route('/api/portfolios/<portfolio_id>/whatif/simulate', methods=['POST'])
 def simulate_scenario(portfolio_id):
     """Simulate a What-If scenario."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    _require_portfolio(portfolio_id)
+    app_dicts = engine_app_dicts(portfolio_id, WHATIF_FIELDS)
     data = request.get_json()
 
-    if not applications:
+    if not app_dicts:
         return jsonify({'error': 'No applications to analyze'}), 400
 
-    app_dicts = _apps_to_whatif_format(applications)
     engine = WhatIfScenarioEngine(app_dicts)
 
     scenario_type = data.get('type', 'retire')
@@ -655,8 +1106,8 @@ def simulate_scenario(portfolio_id):
 @app.route('/whatif/<portfolio_id>')
 def whatif_page(portfolio_id):
     """What-If Scenario simulator page."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    portfolio = portfolio_with_applications_or_404(portfolio_id)
+    applications = portfolio.applications
     return render_template('whatif.html', portfolio=portfolio, applications=applications)
 
 
@@ -664,31 +1115,15 @@ def whatif_page(portfolio_id):
 # ROADMAP API
 # =============================================================================
 
-def _apps_to_roadmap_format(applications):
-    """Convert application objects to Roadmap engine format."""
-    return [
-        {
-            'name': app.name,
-            'cost': app.cost or 0,
-            'tech_health': app.tech_health or 5,
-            'business_value': app.business_value or 5,
-            'category': app.category or 'Other',
-            'description': app.description or ''
-        }
-        for app in applications
-    ]
-
-
 @app.route('/api/portfolios/<portfolio_id>/roadmap', methods=['GET'])
 def get_roadmap(portfolio_id):
     """Get roadmap for a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    _require_portfolio(portfolio_id)
+    app_dicts = engine_app_dicts(portfolio_id, ROADMAP_FIELDS)
 
-    if not applications:
+    if not app_dicts:
         return jsonify({'error': 'No applications to analyze'}), 400
 
-    app_dicts = _apps_to_roadmap_format(applications)
     engine = PrioritizationRoadmapEngine(app_dicts)
 
     return jsonify({
@@ -700,13 +1135,12 @@ def get_roadmap(portfolio_id):
 @app.route('/api/portfolios/<portfolio_id>/roadmap/full', methods=['GET'])
 def get_full_roadmap(portfolio_id):
     """Get complete roadmap with all details."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    _require_portfolio(portfolio_id)
+    app_dicts = engine_app_dicts(portfolio_id, ROADMAP_FIELDS)
 
-    if not applications:
+    if not app_dicts:
         return jsonify({'error': 'No applications to analyze'}), 400
 
-    app_dicts = _apps_to_roadmap_format(applications)
     engine = PrioritizationRoadmapEngine(app_dicts)
 
     return jsonify({
@@ -720,8 +1154,8 @@ def get_full_roadmap(portfolio_id):
 @app.route('/roadmap/<portfolio_id>')
 def roadmap_page(portfolio_id):
     """Roadmap planning page."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    portfolio = portfolio_with_applications_or_404(portfolio_id)
+    applications = portfolio.applications
     return render_template('roadmap.html', portfolio=portfolio, applications=applications)
 
 
@@ -729,33 +1163,43 @@ def roadmap_page(portfolio_id):
 # RISK ASSESSMENT API
 # =============================================================================
 
-def _apps_to_risk_format(applications):
-    """Convert application objects to Risk Assessment format."""
-    return [
-        {
-            'name': app.name,
-            'cost': app.cost or 0,
-            'tech_health': app.tech_health or 5,
-            'business_value': app.business_value or 5,
-            'security': app.security or 5,
-            'category': app.category or 'Other',
-            'description': app.description or ''
-        }
-        for app in applications
-    ]
+RISK_ENGINE_CACHE_SIZE = 32
+_risk_engines = OrderedDict()
+_risk_engines_lock = threading.Lock()
+
+
+def assessed_risk_engine(portfolio_id: str, app_dicts: list) -> RiskAssessmentFramework:
+    """Return a RiskAssessmentFramework for ``app_dicts`` with the portfolio assessed.
+
+    An assessed engine is only read afterwards, so the summary, full, compliance
+    and mitigation routes share one per snapshot of the portfolio's risk inputs.
+    """
+    key = _analysis_key('risk', portfolio_id, [tuple(app.values()) for app in app_dicts])
+    with _risk_engines_lock:
+        engine = _risk_engines.get(key)
+        if engine is not None:
+            _risk_engines.move_to_end(key)
+            return engine
+
+    engine = RiskAssessmentFramework(app_dicts)
+    engine.assess_portfolio()
+    with _risk_engines_lock:
+        _risk_engines[key] = engine
+        while len(_risk_engines) > RISK_ENGINE_CACHE_SIZE:
+            _risk_engines.popitem(last=False)
+    return engine
 
 
 @app.route('/api/portfolios/<portfolio_id>/risk', methods=['GET'])
 def get_risk_assessment(portfolio_id):
     """Get risk assessment summary for a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    _require_portfolio(portfolio_id)
+    app_dicts = engine_app_dicts(portfolio_id, RISK_FIELDS)
 
-    if not applications:
+    if not app_dicts:
         return jsonify({'error': 'No applications to analyze'}), 400
 
-    app_dicts = _apps_to_risk_format(applications)
-    engine = RiskAssessmentFramework(app_dicts)
+    engine = assessed_risk_engine(portfolio_id, app_dicts)
 
     return jsonify({
         'portfolio_id': portfolio_id,
@@ -766,14 +1210,13 @@ def get_risk_assessment(portfolio_id):
 @app.route('/api/portfolios/<portfolio_id>/risk/full', methods=['GET'])
 def get_full_risk_assessment(portfolio_id):
     """Get complete risk assessment with all details."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    _require_portfolio(portfolio_id)
+    app_dicts = engine_app_dicts(portfolio_id, RISK_FIELDS)
 
-    if not applications:
+    if not app_dicts:
         return jsonify({'error': 'No applications to analyze'}), 400
 
-    app_dicts = _apps_to_risk_format(applications)
-    engine = RiskAssessmentFramework(app_dicts)
+    engine = assessed_risk_engine(portfolio_id, app_dicts)
     portfolio_results = engine.assess_portfolio()
 
     return jsonify({
@@ -790,15 +1233,13 @@ def get_full_risk_assessment(portfolio_id):
 @app.route('/api/portfolios/<portfolio_id>/risk/compliance/<framework>', methods=['GET'])
 def get_risk_compliance(portfolio_id, framework):
     """Get compliance check for a specific framework."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    _require_portfolio(portfolio_id)
+    app_dicts = engine_app_dicts(portfolio_id, RISK_FIELDS)
 
-    if not applications:
+    if not app_dicts:
         return jsonify({'error': 'No applications to analyze'}), 400
 
-    app_dicts = _apps_to_risk_format(applications)
-    engine = RiskAssessmentFramework(app_dicts)
-    engine.assess_portfolio()
+    engine = assessed_risk_engine(portfolio_id, app_dicts)
 
     compliance_result = engine.check_compliance(framework)
     return jsonify(compliance_result)
@@ -807,13 +1248,9 @@ def get_risk_compliance(portfolio_id, framework):
 @app.route('/api/applications/<app_id>/risk/mitigation', methods=['GET'])
 def get_mitigation_plan(app_id):
     """Get risk mitigation plan for a specific application."""
-    application = Application.query.get_or_404(app_id)
-    portfolio = application.portfolio
-    applications = portfolio.applications.all()
-
-    app_dicts = _apps_to_risk_format(applications)
-    engine = RiskAssessmentFramework(app_dicts)
-    engine.assess_portfolio()
+    application = db.get_or_404(Application, app_id)
+    app_dicts = engine_app_dicts(application.portfolio_id, RISK_FIELDS)
+    engine = assessed_risk_engine(application.portfolio_id, app_dicts)
 
     mitigation = engine.generate_mitigation_plan(application.name)
     return jsonify(mitigation)
@@ -822,8 +1259,8 @@ def get_mitigation_plan(app_id):
 @app.route('/risk/<portfolio_id>')
 def risk_page(portfolio_id):
     """Risk assessment page."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    portfolio = portfolio_with_applications_or_404(portfolio_id)
+    applications = portfolio.applications
     # Convert to dicts for JSON serialization in template
     applications_data = [app.to_dict() for app in applications]
     return render_template('risk.html', portfolio=portfolio, applications=applications_data)
@@ -833,30 +1270,15 @@ def risk_page(portfolio_id):
 # BENCHMARK API
 # =============================================================================
 
-def _apps_to_benchmark_format(applications):
-    """Convert application objects to Benchmark engine format."""
-    return [
-        {
-            'name': app.name,
-            'cost': app.cost or 0,
-            'tech_health': app.tech_health or 5,
-            'business_value': app.business_value or 5,
-            'category': app.category or 'Other'
-        }
-        for app in applications
-    ]
-
-
 @app.route('/api/portfolios/<portfolio_id>/benchmark', methods=['GET'])
 def get_benchmark(portfolio_id):
     """Get benchmark summary for a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    _require_portfolio(portfolio_id)
+    app_dicts = engine_app_dicts(portfolio_id, BENCHMARK_FIELDS)
 
-    if not applications:
+    if not app_dicts:
         return jsonify({'error': 'No applications to analyze'}), 400
 
-    app_dicts = _apps_to_benchmark_format(applications)
     engine = BenchmarkEngine(app_dicts)
 
     return jsonify({
@@ -868,13 +1290,12 @@ def get_benchmark(portfolio_id):
 @app.route('/api/portfolios/<portfolio_id>/benchmark/full', methods=['GET'])
 def get_full_benchmark(portfolio_id):
     """Get comprehensive benchmark report."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    _require_portfolio(portfolio_id)
+    app_dicts = engine_app_dicts(portfolio_id, BENCHMARK_FIELDS)
 
-    if not applications:
+    if not app_dicts:
         return jsonify({'error': 'No applications to analyze'}), 400
 
-    app_dicts = _apps_to_benchmark_format(applications)
     engine = BenchmarkEngine(app_dicts)
 
     return jsonify({
@@ -886,12 +1307,10 @@ def get_full_benchmark(portfolio_id):
 @app.route('/api/portfolios/<portfolio_id>/benchmark/best-practices', methods=['GET'])
 def get_best_practices(portfolio_id):
     """Get best practices recommendations."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
-
+    _require_portfolio(portfolio_id)
     category = request.args.get('category')
 
-    app_dicts = _apps_to_benchmark_format(applications) if applications else []
+    app_dicts = engine_app_dicts(portfolio_id, BENCHMARK_FIELDS)
     engine = BenchmarkEngine(app_dicts)
 
     practices = engine.get_best_practices(category)
@@ -904,8 +1323,8 @@ def get_best_practices(portfolio_id):
 @app.route('/benchmark/<portfolio_id>')
 def benchmark_page(portfolio_id):
     """Benchmark comparison page."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    portfolio = portfolio_with_applications_or_404(portfolio_id)
+    applications = portfolio.applications
     return render_template('benchmark.html', portfolio=portfolio, applications=applications)
 
 
@@ -913,6 +1332,26 @@ def benchmark_page(portfolio_id):
 # AI CHAT API
 # =============================================================================
 
+# Chat session rows are an audit record only (live sessions are held by the chat
+# engine), so they are written off the request path
+_chat_persist_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='chat-persist')
+
+
+def _persist_chat_session(session_id: str, portfolio_id, organization: str):
+    """Executor entry point: record a chat session inside its own app context."""
+    with app.app_context():
+        try:
+            db.session.add(ChatSession(
+                id=session_id,
+                portfolio_id=portfolio_id,
+                organization_name=organization
+            ))
+            db.session.commit()
+        except Exception as e:
+            logger.error(f"Failed to persist chat session {session_id}: {e}")
+            db.session.rollback()
+
+
 @app.route('/api/chat/start', methods=['POST'])
 def start_chat():
     """Start a new chat session."""
@@ -924,9 +1363,15 @@ def start_chat():
         # Get portfolio data for context
         portfolio_data = None
         if portfolio_id:
-            portfolio = Portfolio.query.get(portfolio_id)
+            portfolio = db.session.get(Portfolio, portfolio_id)
             if portfolio:
-                applications = portfolio.applications.all()
+                # The chat context holds the top 20 applications; fetch only those
+                applications = db.session.scalars(
+                    select(Application)
+                    .where(Application.portfolio_id == portfolio_id)
+                    .order_by(Application.composite_score.desc().nulls_last())
+                    .limit(20)
+                ).all()
                 portfolio_data = {
                     'total_applications': portfolio.total_applications,
                     'total_cost': portfolio.total_cost,
@@ -937,7 +1382,7 @@ def start_chat():
                         'MIGRATE': portfolio.migrate_count,
                         'ELIMINATE': portfolio.eliminate_count
                     },
-                    'applications': [app.to_dict() for app in applications[:20]]
+                    'applications': [app.to_dict() for app in applications]
                 }
 
         # Create chat session
@@ -950,14 +1395,8 @@ def start_chat():
         # Store session ID
         session['chat_session_id'] = chat_session.session_id
 
-        # Save to database
-        db_session = ChatSession(
-            id=chat_session.session_id,
-            portfolio_id=portfolio_id,
-            organization_name=organization
-        )
-        db.session.add(db_session)
-        db.session.commit()
+        # Save to database in the background
+        _chat_persist_executor.submit(_persist_chat_session, chat_session.session_id, portfolio_id, organization)
 
         return jsonify({
             'session_id': chat_session.session_id,
@@ -1003,15 +1442,20 @@ def chat_stream():
             return jsonify({'error': 'No active chat session'}), 400
 
         def generate():
+            # Frame each event as bytes so a chunk costs one orjson call and a concat
+            prefix, suffix = b'data: ', b'\n\n'
             chat_engine = get_chat_engine()
             for chunk in chat_engine.stream_chat(chat_session_id, message):
-                yield f"data: {json.dumps(chunk)}\n\n"
+                yield prefix + json_dumps(chunk) + suffix
 
+        # stream_with_context keeps the app and request contexts (and the
+        # session's teardown) alive until the last event has been sent
         return Response(
-            generate(),
+            stream_with_context(generate()),
             mimetype='text/event-stream',
+            direct_passthrough=True,
             headers={
-                'Cache-Control': 'no-cache',
+                'Cache-Control': 'no-cache, no-transform',
                 'X-Accel-Buffering': 'no'
             }
         )
@@ -1021,6 +1465,9 @@ def chat_stream():
         return jsonify({'error': str(e)}), 500
 
 
+CHAT_MODES = {mode.value: mode for mode in ConversationMode}
+
+
 @app.route('/api/chat/mode', methods=['POST'])
 def change_chat_mode():
     """Change chat conversation mode."""
@@ -1031,8 +1478,12 @@ def change_chat_mode():
     if not chat_session_id:
         return jsonify({'error': 'No active chat session'}), 400
 
+    mode = CHAT_MODES.get(new_mode)
+    if mode is None:
+        return jsonify({'error': f'Unknown chat mode: {new_mode}'}), 400
+
     chat_engine = get_chat_engine()
-    success = chat_engine.change_mode(chat_session_id, ConversationMode(new_mode))
+    success = chat_engine.change_mode(chat_session_id, mode)
 
     return jsonify({
         'success': success,
@@ -1198,68 +1649,39 @@ def create_demo_data():
         if first_portfolio is None:
             first_portfolio = portfolio
 
+        # Score in memory, then write the portfolio's applications as one bulk
+        # INSERT and take its metrics from the same results
+        rows = []
         for app_data in portfolio_data['apps']:
-            application = Application(
-                portfolio_id=portfolio.id,
-                **app_data
-            )
-            results = rationalization_engine.process_single_application(application.to_scoring_dict())
-            application.apply_scoring_results(results)
-            db.session.add(application)
-            total_apps += 1
-
-        db.session.commit()
-        portfolio.update_metrics()
+            results = rationalization_engine.process_single_application(app_data)
+            rows.append({
+                'portfolio_id': portfolio.id,
+                **app_data,
+                **{field: results.get(field) for field in Application.SCORING_RESULT_FIELDS}
+            })
+        db.session.execute(insert(Application), rows)
+        portfolio.apply_metrics([(row['cost'], row['composite_score'], row['time_category']) for row in rows])
+        total_apps += len(rows)
 
         # Auto-run cost analysis so costs page has data
         try:
-            app_dicts = [a.to_dict() for a in portfolio.applications.all()]
-            cost_modeler = CostModeler(app_dicts)
-            tco_summary = cost_modeler.calculate_tco_breakdown()
-            cost_modeler.identify_hidden_costs()
-            optimization = cost_modeler.get_cost_optimization_summary()
-
-            cost_analysis = CostAnalysis(
-                portfolio_id=portfolio.id,
-                total_portfolio_cost=optimization['current_portfolio_cost'],
-                hidden_costs_total=optimization['hidden_costs_total'],
-                potential_savings=optimization['potential_savings'],
-                savings_percentage=optimization['savings_percentage'],
-                component_breakdown=tco_summary['component_breakdown'],
-                department_allocation=optimization['department_allocation'],
-                hidden_cost_categories=optimization['hidden_cost_categories'],
-                quick_wins=optimization['quick_wins'],
-                top_opportunities=optimization['top_opportunities']
-            )
-            db.session.add(cost_analysis)
+            app_dicts = application_dicts(portfolio.id, COST_MODEL_FIELDS + COMPLIANCE_FIELDS)
+            tco_summary, optimization = model_costs(app_dicts)
+            db.session.add(cost_analysis_record(portfolio.id, tco_summary, optimization))
         except Exception as e:
             logger.warning(f"Cost analysis pre-population failed for {portfolio.name}: {e}")
 
         # Auto-run compliance assessments so compliance page has data
         try:
-            compliance_engine = ComplianceEngine()
+            compliance_engine = get_compliance_engine()
+            rows = []
             for fw in compliance_engine.list_frameworks():
                 fw_name = fw['name']
                 results = compliance_engine.batch_assess(app_dicts, fw_name)
                 if 'error' not in results:
-                    for assessment in results['application_assessments']:
-                        result = ComplianceResult(
-                            application_id=assessment.get('application_id'),
-                            portfolio_id=portfolio.id,
-                            framework=fw_name,
-                            compliance_percentage=assessment['compliance_percentage'],
-                            compliance_level=assessment['compliance_level'],
-                            risk_level=assessment['risk_level'],
-                            total_requirements=assessment['total_requirements'],
-                            compliant_count=assessment['compliant_count'],
-                            partial_count=assessment['partial_count'],
-                            non_compliant_count=assessment['non_compliant_count'],
-                            critical_gaps_count=assessment['critical_gaps_count'],
-                            requirement_results=assessment['requirement_results'],
-                            gaps=assessment['gaps'],
-                            critical_gaps=assessment['critical_gaps']
-                        )
-                        db.session.add(result)
+                    rows.extend(compliance_result_rows(portfolio.id, fw_name, results['application_assessments']))
+            if rows:
+                db.session.execute(insert(ComplianceResult), rows)
         except Exception as e:
             logger.warning(f"Compliance pre-population failed for {portfolio.name}: {e}")
 
@@ -1278,18 +1700,32 @@ def create_demo_data():
 # TIER 2: DEPENDENCY MAPPING API
 # =============================================================================
 
+# Dependency and integration to_dict() name the applications at both ends; load
+# just those names in one batched SELECT per side instead of a query per row
+DEPENDENCY_APP_NAMES = (
+    selectinload(ApplicationDependency.source_app).load_only(Application.name),
+    selectinload(ApplicationDependency.target_app).load_only(Application.name),
+)
+INTEGRATION_APP_NAMES = (
+    selectinload(ApplicationIntegration.source_app).load_only(Application.name),
+    selectinload(ApplicationIntegration.target_app).load_only(Application.name),
+)
+
+
 @app.route('/api/portfolios/<portfolio_id>/dependencies', methods=['GET'])
 def get_dependencies(portfolio_id):
     """Get all dependencies in a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    dependencies = ApplicationDependency.query.filter_by(portfolio_id=portfolio_id).all()
+    _require_portfolio(portfolio_id)
+    dependencies = ApplicationDependency.query.filter_by(portfolio_id=portfolio_id).options(
+        *DEPENDENCY_APP_NAMES
+    ).all()
     return jsonify([d.to_dict() for d in dependencies])
 
 
 @app.route('/api/portfolios/<portfolio_id>/dependencies', methods=['POST'])
 def create_dependency(portfolio_id):
     """Create a new dependency between applications."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    _require_portfolio(portfolio_id)
     data = request.get_json()
 
     dependency = ApplicationDependency(
@@ -1314,7 +1750,7 @@ def create_dependency(portfolio_id):
 @app.route('/api/dependencies/<dep_id>', methods=['DELETE'])
 def delete_dependency(dep_id):
     """Delete a dependency."""
-    dependency = ApplicationDependency.query.get_or_404(dep_id)
+    dependency = db.get_or_404(ApplicationDependency, dep_id)
     db.session.delete(dependency)
     db.session.commit()
     return jsonify({'success': True})
@@ -1323,8 +1759,8 @@ def delete_dependency(dep_id):
 @app.route('/api/portfolios/<portfolio_id>/dependencies/analyze', methods=['POST'])
 def analyze_dependencies(portfolio_id):
     """Run dependency analysis on a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    portfolio = portfolio_with_applications_or_404(portfolio_id)
+    applications = portfolio.applications
     dependencies = ApplicationDependency.query.filter_by(portfolio_id=portfolio_id).all()
 
     if not applications:
@@ -1414,8 +1850,8 @@ def analyze_dependencies(portfolio_id):
 @app.route('/api/portfolios/<portfolio_id>/dependencies/visualization', methods=['GET'])
 def get_dependency_visualization(portfolio_id):
     """Get dependency graph data for visualization."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    portfolio = portfolio_with_applications_or_404(portfolio_id)
+    applications = portfolio.applications
     dependencies = ApplicationDependency.query.filter_by(portfolio_id=portfolio_id).all()
 
     # Build nodes and edges for visualization
@@ -1446,8 +1882,8 @@ def get_dependency_visualization(portfolio_id):
 @app.route('/dependencies/<portfolio_id>')
 def dependencies_page(portfolio_id):
     """Dependency mapping page."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    portfolio = portfolio_with_applications_or_404(portfolio_id)
+    applications = portfolio.applications
     return render_template('dependencies.html', portfolio=portfolio, applications=applications)
 
 
@@ -1458,15 +1894,17 @@ def dependencies_page(portfolio_id):
 @app.route('/api/portfolios/<portfolio_id>/integrations', methods=['GET'])
 def get_integrations(portfolio_id):
     """Get all integrations in a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    integrations = ApplicationIntegration.query.filter_by(portfolio_id=portfolio_id).all()
+    _require_portfolio(portfolio_id)
+    integrations = ApplicationIntegration.query.filter_by(portfolio_id=portfolio_id).options(
+        *INTEGRATION_APP_NAMES
+    ).all()
     return jsonify([i.to_dict() for i in integrations])
 
 
 @app.route('/api/portfolios/<portfolio_id>/integrations', methods=['POST'])
 def create_integration(portfolio_id):
     """Create a new integration."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    _require_portfolio(portfolio_id)
     data = request.get_json()
 
     integration = ApplicationIntegration(
@@ -1504,7 +1942,7 @@ def create_integration(portfolio_id):
 @app.route('/api/integrations/<int_id>', methods=['PUT'])
 def update_integration(int_id):
     """Update an integration."""
-    integration = ApplicationIntegration.query.get_or_404(int_id)
+    integration = db.get_or_404(ApplicationIntegration, int_id, options=[*INTEGRATION_APP_NAMES])
     data = request.get_json()
 
     # Update fields
@@ -1530,7 +1968,7 @@ def update_integration(int_id):
 @app.route('/api/integrations/<int_id>', methods=['DELETE'])
 def delete_integration(int_id):
     """Delete an integration."""
-    integration = ApplicationIntegration.query.get_or_404(int_id)
+    integration = db.get_or_404(ApplicationIntegration, int_id)
     db.session.delete(integration)
     db.session.commit()
     return jsonify({'success': True})
@@ -1539,16 +1977,19 @@ def delete_integration(int_id):
 @app.route('/api/portfolios/<portfolio_id>/integrations/analyze', methods=['POST'])
 def analyze_integrations(portfolio_id):
     """Run integration health analysis on a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    integrations = ApplicationIntegration.query.filter_by(portfolio_id=portfolio_id).all()
+    _require_portfolio(portfolio_id)
+    integrations = ApplicationIntegration.query.filter_by(portfolio_id=portfolio_id).options(
+        *INTEGRATION_APP_NAMES
+    ).all()
 
     if not integrations:
         return jsonify({'error': 'No integrations in portfolio'}), 400
 
-    # Calculate health scores for all integrations
+    # Calculate health scores for all integrations; they are committed together
+    # with the analysis row below, so the instances are not expired (and
+    # reloaded one by one) in between
     for integration in integrations:
         integration.calculate_health_score()
-    db.session.commit()
 
     # Aggregate statistics
     total = len(integrations)
@@ -1653,8 +2094,8 @@ def analyze_integrations(portfolio_id):
 @app.route('/integrations/<portfolio_id>')
 def integrations_page(portfolio_id):
     """Integration assessment page."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    portfolio = portfolio_with_applications_or_404(portfolio_id)
+    applications = portfolio.applications
     return render_template('integrations.html', portfolio=portfolio, applications=applications)
 
 
@@ -1662,18 +2103,48 @@ def integrations_page(portfolio_id):
 # TIER 2: VENDOR RISK MANAGEMENT API
 # =============================================================================
 
+# Stored compliance names -> vendor risk engine frameworks
+VENDOR_COMPLIANCE_MAP = {
+    'SOC2': VCF.SOC2, 'ISO27001': VCF.ISO27001, 'HIPAA': VCF.HIPAA,
+    'PCI_DSS': VCF.PCI_DSS, 'GDPR': VCF.GDPR, 'FEDRAMP': VCF.FEDRAMP,
+    'SOX': VCF.SOX, 'CJIS': VCF.CJIS, 'FISMA': VCF.FISMA
+}
+
+# Stored tier/status strings -> engine enums (plain dict hits instead of Enum lookups)
+VENDOR_TIER_LOOKUP = {t.value: t for t in VendorTier}
+VENDOR_STATUS_LOOKUP = {s.value: s for s in VendorStatus}
+
+
+def _parse_date(value):
+    """Parse a YYYY-MM-DD string into a date, or None if empty."""
+    return date.fromisoformat(value) if value else None
+
+
+def _require_portfolio(portfolio_id):
+    """404 unless the portfolio exists, without loading the full row."""
+    if db.session.query(Portfolio.id).filter_by(id=portfolio_id).scalar() is None:
+        abort(404)
+
+
+def _portfolio_header_or_404(portfolio_id: str):
+    """Load just the id and name of a portfolio, or 404."""
+    return Portfolio.query.options(load_only(Portfolio.id, Portfolio.name)).filter_by(id=portfolio_id).first_or_404()
+
+
 @app.route('/api/portfolios/<portfolio_id>/vendors', methods=['GET'])
 def get_vendors(portfolio_id):
     """Get all vendors for a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    vendors = Vendor.query.filter_by(portfolio_id=portfolio_id).all()
-    return jsonify([v.to_dict() for v in vendors])
+    _require_portfolio(portfolio_id)
+    # Vendor.to_dict() only reads columns; fail fast if a relationship sneaks in
+    vendors = Vendor.query.filter_by(portfolio_id=portfolio_id).options(raiseload('*')).yield_per(500)
+    return Response(stream_with_context(stream_json_list(map(Vendor.to_dict, vendors))),
+                    mimetype='application/json')
 
 
 @app.route('/api/portfolios/<portfolio_id>/vendors', methods=['POST'])
 def create_vendor(portfolio_id):
     """Create a new vendor."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    _require_portfolio(portfolio_id)
     data = request.get_json()
 
     vendor = Vendor(
@@ -1686,15 +2157,15 @@ def create_vendor(portfolio_id):
         financial_rating=data.get('financial_rating'),
         publicly_traded=data.get('publicly_traded', False),
         stock_symbol=data.get('stock_symbol'),
-        contract_start=datetime.strptime(data['contract_start'], '%Y-%m-%d').date() if data.get('contract_start') else None,
-        contract_end=datetime.strptime(data['contract_end'], '%Y-%m-%d').date() if data.get('contract_end') else None,
+        contract_start=_parse_date(data.get('contract_start')),
+        contract_end=_parse_date(data.get('contract_end')),
         annual_spend=data.get('annual_spend', 0),
         payment_terms=data.get('payment_terms', 'NET30'),
         contract_type=data.get('contract_type'),
         auto_renewal=data.get('auto_renewal', False),
         security_score=data.get('security_score'),
         compliances=data.get('compliances', []),
-        last_security_audit=datetime.strptime(data['last_security_audit'], '%Y-%m-%d').date() if data.get('last_security_audit') else None,
+        last_security_audit=_parse_date(data.get('last_security_audit')),
         has_incident_history=data.get('has_incident_history', False),
         incident_details=data.get('incident_details'),
         has_dr_plan=data.get('has_dr_plan', False),
@@ -1720,14 +2191,14 @@ def create_vendor(portfolio_id):
 @app.route('/api/vendors/<vendor_id>', methods=['GET'])
 def get_vendor(vendor_id):
     """Get a specific vendor."""
-    vendor = Vendor.query.get_or_404(vendor_id)
+    vendor = db.get_or_404(Vendor, vendor_id)
     return jsonify(vendor.to_dict())
 
 
 @app.route('/api/vendors/<vendor_id>', methods=['PUT'])
 def update_vendor(vendor_id):
     """Update a vendor."""
-    vendor = Vendor.query.get_or_404(vendor_id)
+    vendor = db.get_or_404(Vendor, vendor_id)
     data = request.get_json()
 
     # Update simple fields
@@ -1741,19 +2212,21 @@ def update_vendor(vendor_id):
         'support_tier', 'website', 'documentation_url', 'notes'
     ]
 
+    # Only touch fields whose value actually changes
     for field in simple_fields:
-        if field in data:
+        if field in data and getattr(vendor, field) != data[field]:
             setattr(vendor, field, data[field])
 
     # Update date fields
-    if 'contract_start' in data:
-        vendor.contract_start = datetime.strptime(data['contract_start'], '%Y-%m-%d').date() if data['contract_start'] else None
-    if 'contract_end' in data:
-        vendor.contract_end = datetime.strptime(data['contract_end'], '%Y-%m-%d').date() if data['contract_end'] else None
-    if 'last_security_audit' in data:
-        vendor.last_security_audit = datetime.strptime(data['last_security_audit'], '%Y-%m-%d').date() if data['last_security_audit'] else None
+    for field in ('contract_start', 'contract_end', 'last_security_audit'):
+        if field in data:
+            value = _parse_date(data[field])
+            if getattr(vendor, field) != value:
+                setattr(vendor, field, value)
 
-    db.session.commit()
+    # Idempotent PUTs issue no UPDATE at all
+    if db.session.is_modified(vendor):
+        db.session.commit()
 
     return jsonify(vendor.to_dict())
 
@@ -1761,45 +2234,24 @@ def update_vendor(vendor_id):
 @app.route('/api/vendors/<vendor_id>', methods=['DELETE'])
 def delete_vendor(vendor_id):
     """Delete a vendor."""
-    vendor = Vendor.query.get_or_404(vendor_id)
+    vendor = db.get_or_404(Vendor, vendor_id)
     db.session.delete(vendor)
     db.session.commit()
     return jsonify({'success': True})
 
 
-@app.route('/api/vendors/<vendor_id>/assess', methods=['POST'])
-def assess_vendor(vendor_id):
-    """Run risk assessment on a vendor."""
-    vendor = Vendor.query.get_or_404(vendor_id)
-    data = request.get_json() or {}
-
-    industry = data.get('industry', 'general')
-    total_it_spend = data.get('total_it_spend', 1000000)
-
-    # Use the vendor risk engine
-    engine = VendorRiskEngine()
-
-    # Convert vendor to engine format
-    from rationalization.vendor_risk_engine import VendorProfile, VendorTier, VendorStatus, ComplianceFramework as VCF
-    from datetime import date
-
-    # Map compliances
-    compliance_map = {
-        'SOC2': VCF.SOC2, 'ISO27001': VCF.ISO27001, 'HIPAA': VCF.HIPAA,
-        'PCI_DSS': VCF.PCI_DSS, 'GDPR': VCF.GDPR, 'FEDRAMP': VCF.FEDRAMP,
-        'SOX': VCF.SOX, 'CJIS': VCF.CJIS, 'FISMA': VCF.FISMA
-    }
-
-    compliances = []
-    for c in (vendor.compliances or []):
-        if c.upper() in compliance_map:
-            compliances.append(compliance_map[c.upper()])
+def vendor_profile(vendor: Vendor) -> VendorProfile:
+    """Convert a vendor row to the risk engine's profile format."""
+    compliances = [
+        VENDOR_COMPLIANCE_MAP[c.upper()] for c in (vendor.compliances or [])
+        if c.upper() in VENDOR_COMPLIANCE_MAP
+    ]
 
-    profile = VendorProfile(
+    return VendorProfile(
         vendor_id=vendor.id,
         name=vendor.name,
-        tier=VendorTier(vendor.tier) if vendor.tier else VendorTier.TACTICAL,
-        status=VendorStatus(vendor.status) if vendor.status else VendorStatus.ACTIVE,
+        tier=VENDOR_TIER_LOOKUP.get(vendor.tier, VendorTier.TACTICAL),
+        status=VENDOR_STATUS_LOOKUP.get(vendor.status, VendorStatus.ACTIVE),
         annual_revenue=vendor.annual_revenue,
         years_in_business=vendor.years_in_business,
         financial_rating=vendor.financial_rating,
@@ -1816,13 +2268,20 @@ def assess_vendor(vendor_id):
         geographic_presence=vendor.geographic_presence or []
     )
 
+
+def score_vendor(profile: VendorProfile, industry: str, total_it_spend: float):
+    """Run the vendor risk engine on one profile."""
+    engine = VendorRiskEngine()
     engine.add_vendor(profile)
-    assessment_result = engine.assess_vendor(vendor.id, industry, total_it_spend)
+    return engine.assess_vendor(profile.vendor_id, industry, total_it_spend)
+
 
-    # Save assessment to database
+def save_vendor_assessment(assessment_result, vendor_id: str, portfolio_id: str,
+                           industry: str, total_it_spend: float) -> dict:
+    """Store a vendor assessment and return it as a dict."""
     assessment = VendorAssessment(
-        vendor_id=vendor.id,
-        portfolio_id=vendor.portfolio_id,
+        vendor_id=vendor_id,
+        portfolio_id=portfolio_id,
         overall_risk_level=assessment_result.overall_risk_level.value,
         overall_risk_score=assessment_result.overall_risk_score,
         financial_risk_score=assessment_result.financial_risk_score,
@@ -1838,21 +2297,53 @@ def assess_vendor(vendor_id):
     )
 
     db.session.add(assessment)
+    # Serialize before commit expires the instance, saving a reload SELECT
+    db.session.flush()
+    result = assessment.to_dict()
     db.session.commit()
 
-    return jsonify({
-        'success': True,
-        'assessment': assessment.to_dict()
-    })
+    return result
+
+
+@app.route('/api/vendors/<vendor_id>/assess', methods=['POST'])
+def assess_vendor(vendor_id):
+    """Run risk assessment on a vendor.
+
+    Pass ``"background": true`` to run it as a job; see /api/jobs/<job_id>.
+    """
+    vendor = db.get_or_404(Vendor, vendor_id)
+    data = request.get_json() or {}
+
+    industry = data.get('industry', 'general')
+    total_it_spend = data.get('total_it_spend', 1000000)
+    profile = vendor_profile(vendor)
+
+    if data.get('background'):
+        return submit_saved_analysis_job(score_vendor, (profile, industry, total_it_spend),
+                                         save_vendor_assessment, vendor.id, vendor.portfolio_id,
+                                         industry, total_it_spend)
+
+    assessment = save_vendor_assessment(score_vendor(profile, industry, total_it_spend),
+                                        vendor.id, vendor.portfolio_id, industry, total_it_spend)
+    return jsonify({'success': True, 'assessment': assessment})
 
 
 @app.route('/api/portfolios/<portfolio_id>/vendors/summary', methods=['GET'])
 def get_vendor_summary(portfolio_id):
     """Get vendor portfolio summary."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    vendors = Vendor.query.filter_by(portfolio_id=portfolio_id).all()
-
-    if not vendors:
+    _require_portfolio(portfolio_id)
+
+    # Tier/status histogram and spend in one grouped query
+    tier_col = func.coalesce(Vendor.tier, 'unclassified')
+    status_col = func.coalesce(Vendor.status, 'unknown')
+    groups = db.session.query(
+        tier_col.label('tier'),
+        status_col.label('status'),
+        func.count(Vendor.id).label('n'),
+        func.sum(func.coalesce(Vendor.annual_spend, 0)).label('spend')
+    ).filter(Vendor.portfolio_id == portfolio_id).group_by(tier_col, status_col).all()
+
+    if not groups:
         return jsonify({
             'total_vendors': 0,
             'total_spend': 0,
@@ -1861,49 +2352,49 @@ def get_vendor_summary(portfolio_id):
             'expiring_contracts': []
         })
 
-    # Calculate summary
-    total_spend = sum(v.annual_spend or 0 for v in vendors)
-
-    tier_dist = {}
-    status_dist = {}
-    expiring = []
-
-    for vendor in vendors:
-        # Tier distribution
-        tier = vendor.tier or 'unclassified'
-        tier_dist[tier] = tier_dist.get(tier, 0) + 1
-
-        # Status distribution
-        status = vendor.status or 'unknown'
-        status_dist[status] = status_dist.get(status, 0) + 1
-
-        # Expiring contracts
-        if vendor.contract_end:
-            days = vendor.days_until_contract_end()
-            if days is not None and 0 < days <= 180:
-                expiring.append({
-                    'vendor_id': vendor.id,
-                    'vendor_name': vendor.name,
-                    'contract_end': vendor.contract_end.isoformat(),
-                    'days_remaining': days,
-                    'annual_spend': vendor.annual_spend
-                })
-
-    expiring.sort(key=lambda x: x['days_remaining'])
+    total_vendors = 0
+    total_spend = 0
+    tier_dist = Counter()
+    status_dist = Counter()
+
+    for row in groups:
+        total_vendors += row.n
+        total_spend += row.spend or 0
+        tier_dist[row.tier] += row.n
+        status_dist[row.status] += row.n
+
+    # Contracts ending within the next 180 days, soonest first
+    today = date.today()
+    cutoff = today + timedelta(days=180)
+    expiring_rows = db.session.query(
+        Vendor.id, Vendor.name, Vendor.contract_end, Vendor.annual_spend
+    ).filter(
+        Vendor.portfolio_id == portfolio_id,
+        Vendor.contract_end > today,
+        Vendor.contract_end <= cutoff
+    ).order_by(Vendor.contract_end).limit(10).all()
+
+    expiring = [{
+        'vendor_id': row.id,
+        'vendor_name': row.name,
+        'contract_end': row.contract_end.isoformat(),
+        'days_remaining': (row.contract_end - today).days,
+        'annual_spend': row.annual_spend
+    } for row in expiring_rows]
 
     return jsonify({
-        'total_vendors': len(vendors),
+        'total_vendors': total_vendors,
         'total_spend': total_spend,
-        'tier_distribution': tier_dist,
-        'status_distribution': status_dist,
-        'expiring_contracts': expiring[:10]
+        'tier_distribution': dict(tier_dist),
+        'status_distribution': dict(status_dist),
+        'expiring_contracts': expiring
     })
 
 
 @app.route('/vendors/<portfolio_id>')
 def vendors_page(portfolio_id):
     """Vendor management page."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    portfolio = db.get_or_404(Portfolio, portfolio_id)
     vendors = Vendor.query.filter_by(portfolio_id=portfolio_id).all()
     return render_template('vendors.html', portfolio=portfolio, vendors=vendors)
 
@@ -1915,40 +2406,43 @@ def vendors_page(portfolio_id):
 @app.route('/api/demo/tier2/<portfolio_id>', methods=['POST'])
 def create_tier2_demo_data(portfolio_id):
     """Create demo data for Tier 2 features (dependencies, integrations, vendors)."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    _require_portfolio(portfolio_id)
 
-    if len(applications) < 3:
+    # Only the IDs are needed, so skip hydrating full Application rows
+    app_ids = [
+        app_id for (app_id,) in
+        db.session.query(Application.id).filter_by(portfolio_id=portfolio_id).all()
+    ]
+
+    if len(app_ids) < 3:
         return jsonify({'error': 'Need at least 3 applications for demo data'}), 400
 
-    # Create sample dependencies
-    dependencies_created = 0
-    app_ids = [app.id for app in applications]
+    n_apps = len(app_ids)
 
     # Create some realistic dependencies
     sample_deps = [
         (0, 1, 'api', 'strong'),
         (1, 2, 'data', 'medium'),
         (2, 0, 'reporting', 'weak'),  # Creates a cycle for testing
-        (0, 3, 'authentication', 'critical') if len(app_ids) > 3 else None,
-        (1, 4, 'data', 'medium') if len(app_ids) > 4 else None,
     ]
+    if n_apps > 3:
+        sample_deps.append((0, 3, 'authentication', 'critical'))
+    if n_apps > 4:
+        sample_deps.append((1, 4, 'data', 'medium'))
 
-    for dep_info in sample_deps:
-        if dep_info and dep_info[0] < len(app_ids) and dep_info[1] < len(app_ids):
-            dep = ApplicationDependency(
-                portfolio_id=portfolio_id,
-                source_app_id=app_ids[dep_info[0]],
-                target_app_id=app_ids[dep_info[1]],
-                dependency_type=dep_info[2],
-                strength=dep_info[3],
-                description=f'Auto-generated {dep_info[2]} dependency'
-            )
-            db.session.add(dep)
-            dependencies_created += 1
+    dependencies = [
+        ApplicationDependency(
+            portfolio_id=portfolio_id,
+            source_app_id=app_ids[source],
+            target_app_id=app_ids[target],
+            dependency_type=dep_type,
+            strength=strength,
+            description=f'Auto-generated {dep_type} dependency'
+        )
+        for source, target, dep_type, strength in sample_deps
+    ]
 
     # Create sample integrations
-    integrations_created = 0
     sample_ints = [
         {'type': 'api', 'protocol': 'REST', 'latency': 150, 'error_rate': 0.5, 'uptime': 99.9},
         {'type': 'database', 'protocol': 'SQL', 'latency': 50, 'error_rate': 0.1, 'uptime': 99.99},
@@ -1956,29 +2450,28 @@ def create_tier2_demo_data(portfolio_id):
         {'type': 'message_queue', 'protocol': 'Kafka', 'latency': 10, 'error_rate': 0.01, 'uptime': 99.95},
     ]
 
-    for i, int_info in enumerate(sample_ints):
-        if i < len(app_ids) - 1:
-            integration = ApplicationIntegration(
-                portfolio_id=portfolio_id,
-                source_app_id=app_ids[i],
-                target_app_id=app_ids[i + 1],
-                integration_type=int_info['type'],
-                protocol=int_info['protocol'],
-                avg_latency_ms=int_info['latency'],
-                error_rate_percent=int_info['error_rate'],
-                uptime_percent=int_info['uptime'],
-                data_sensitivity='internal',
-                daily_transactions=1000 * (i + 1),
-                has_monitoring=i % 2 == 0,
-                has_error_handling=True,
-                has_retry_mechanism=i % 3 == 0
-            )
-            integration.calculate_health_score()
-            db.session.add(integration)
-            integrations_created += 1
+    integrations = []
+    for i, int_info in enumerate(sample_ints[:n_apps - 1]):
+        integration = ApplicationIntegration(
+            portfolio_id=portfolio_id,
+            source_app_id=app_ids[i],
+            target_app_id=app_ids[i + 1],
+            integration_type=int_info['type'],
+            protocol=int_info['protocol'],
+            avg_latency_ms=int_info['latency'],
+            error_rate_percent=int_info['error_rate'],
+            uptime_percent=int_info['uptime'],
+            data_sensitivity='internal',
+            daily_transactions=1000 * (i + 1),
+            has_monitoring=i % 2 == 0,
+            has_error_handling=True,
+            has_retry_mechanism=i % 3 == 0
+        )
+        # Score before the bulk insert, which bypasses the ORM unit of work
+        integration.calculate_health_score()
+        integrations.append(integration)
 
     # Create sample vendors
-    vendors_created = 0
     sample_vendors = [
         {'name': 'Microsoft', 'tier': 'strategic', 'spend': 250000, 'rating': 'AAA'},
         {'name': 'Salesforce', 'tier': 'strategic', 'spend': 150000, 'rating': 'AA'},
@@ -1986,8 +2479,8 @@ def create_tier2_demo_data(portfolio_id):
         {'name': 'Acme Software', 'tier': 'commodity', 'spend': 25000, 'rating': 'BBB'},
     ]
 
-    for v_info in sample_vendors:
-        vendor = Vendor(
+    vendors = [
+        Vendor(
             portfolio_id=portfolio_id,
             name=v_info['name'],
             tier=v_info['tier'],
@@ -1999,16 +2492,17 @@ def create_tier2_demo_data(portfolio_id):
             sla_uptime=99.9,
             compliances=['SOC2', 'ISO27001']
         )
-        db.session.add(vendor)
-        vendors_created += 1
+        for v_info in sample_vendors
+    ]
 
+    db.session.bulk_save_objects(dependencies + integrations + vendors)
     db.session.commit()
 
     return jsonify({
         'success': True,
-        'dependencies_created': dependencies_created,
-        'integrations_created': integrations_created,
-        'vendors_created': vendors_created
+        'dependencies_created': len(dependencies),
+        'integrations_created': len(integrations),
+        'vendors_created': len(vendors)
     })
 
 
@@ -2016,16 +2510,24 @@ def create_tier2_demo_data(portfolio_id):
 # TIER 2: TECHNICAL DEBT CALCULATOR API
 # =============================================================================
 
+@lru_cache(maxsize=1)
+def get_tech_debt_calculator():
+    """Get the shared demo tech debt calculator.
+
+    Every portfolio is served the same demo data, so one instance is built
+    and reused. The endpoints below only read it; call
+    get_tech_debt_calculator.cache_clear() if it ever gets mutated.
+    """
+    return create_demo_tech_debt()
+
+
 @app.route('/api/portfolios/<portfolio_id>/tech-debt', methods=['GET'])
 def get_tech_debt_summary(portfolio_id):
     """Get technical debt summary for a portfolio."""
-    from rationalization import create_demo_tech_debt
-
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    portfolio = _portfolio_header_or_404(portfolio_id)
 
     # Create calculator with demo data based on portfolio apps
-    calc = create_demo_tech_debt()
+    calc = get_tech_debt_calculator()
 
     # Get summary
     summary = calc.get_portfolio_summary()
@@ -2042,8 +2544,8 @@ def get_app_tech_debt(portfolio_id, app_id):
     """Get technical debt profile for a specific application."""
     from rationalization import create_tech_debt_calculator
 
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    application = Application.query.get_or_404(app_id)
+    _require_portfolio(portfolio_id)
+    application = db.get_or_404(Application, app_id)
 
     # Create calculator and assess app with metrics from app data
     calc = create_tech_debt_calculator()
@@ -2076,15 +2578,13 @@ def get_app_tech_debt(portfolio_id, app_id):
 @app.route('/api/portfolios/<portfolio_id>/tech-debt/roadmap', methods=['GET'])
 def get_tech_debt_roadmap(portfolio_id):
     """Generate technical debt paydown roadmap."""
-    from rationalization import create_demo_tech_debt
-
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    portfolio = _portfolio_header_or_404(portfolio_id)
 
     # Get parameters
     budget_hours = request.args.get('budget_hours', 40, type=float)
     sprint_weeks = request.args.get('sprint_weeks', 2, type=int)
 
-    calc = create_demo_tech_debt()
+    calc = get_tech_debt_calculator()
     roadmap = calc.generate_paydown_roadmap(budget_hours, sprint_weeks)
 
     return jsonify({
@@ -2099,12 +2599,10 @@ def get_tech_debt_roadmap(portfolio_id):
 @app.route('/api/portfolios/<portfolio_id>/tech-debt/trends', methods=['GET'])
 def get_tech_debt_trends(portfolio_id):
     """Get technical debt trends over time."""
-    from rationalization import create_demo_tech_debt
-
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    portfolio = _portfolio_header_or_404(portfolio_id)
 
     days = request.args.get('days', 90, type=int)
-    calc = create_demo_tech_debt()
+    calc = get_tech_debt_calculator()
     trends = calc.get_debt_trends(days)
 
     return jsonify({
@@ -2117,16 +2615,14 @@ def get_tech_debt_trends(portfolio_id):
 @app.route('/api/portfolios/<portfolio_id>/tech-debt/items', methods=['GET'])
 def get_tech_debt_items(portfolio_id):
     """Get all technical debt items for a portfolio."""
-    from rationalization import create_demo_tech_debt
-
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    _require_portfolio(portfolio_id)
 
     # Filter parameters
     category = request.args.get('category')
     severity = request.args.get('severity')
     status = request.args.get('status')
 
-    calc = create_demo_tech_debt()
+    calc = get_tech_debt_calculator()
     summary = calc.get_portfolio_summary()
 
     items = summary.top_priority_items
@@ -2147,8 +2643,8 @@ def get_tech_debt_items(portfolio_id):
 @app.route('/tech-debt/<portfolio_id>')
 def tech_debt_page(portfolio_id):
     """Technical debt dashboard page."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
+    portfolio = portfolio_with_applications_or_404(portfolio_id)
+    applications = portfolio.applications
     return render_template('tech_debt.html', portfolio=portfolio, applications=applications)
 
 
@@ -2156,81 +2652,152 @@ def tech_debt_page(portfolio_id):
 # TIER 2: APPLICATION LIFECYCLE MANAGEMENT API
 # =============================================================================
 
-# Store lifecycle managers per portfolio (in production, this would be in database)
-_lifecycle_managers = {}
+# Request values -> lifecycle enums (dict lookups instead of Enum construction + ValueError)
+LIFECYCLE_STAGE_LOOKUP = {stage.value: stage for stage in LifecycleStage}
+SUNSET_REASON_LOOKUP = {reason.value: reason for reason in SunsetReason}
+
+# Store lifecycle managers per portfolio (in production, this would be in database).
+# Untouched demo managers are a bounded LRU with an idle TTL so long-running
+# workers don't accumulate them forever; a manager changed since it was seeded
+# holds user-entered data and is never expired or evicted.
+LIFECYCLE_CACHE_SIZE = 128
+LIFECYCLE_CACHE_TTL = 3600  # seconds since last use
+_lifecycle_managers = OrderedDict()  # portfolio_id -> (manager, last_used, seeded_version)
+_lifecycle_lock = threading.Lock()
 
 
 def get_lifecycle_manager(portfolio_id: str) -> LifecycleManager:
     """Get or create a lifecycle manager for a portfolio."""
-    if portfolio_id not in _lifecycle_managers:
+    now = time.monotonic()
+    with _lifecycle_lock:
+        entry = _lifecycle_managers.get(portfolio_id)
+        if entry is not None:
+            manager, last_used, seeded_version = entry
+            if manager.version != seeded_version or now - last_used < LIFECYCLE_CACHE_TTL:
+                _lifecycle_managers[portfolio_id] = (manager, now, seeded_version)
+                _lifecycle_managers.move_to_end(portfolio_id)
+                return manager
+
         # Create new manager and populate with demo data
         manager, _ = create_demo_lifecycles()
-        _lifecycle_managers[portfolio_id] = manager
-    return _lifecycle_managers[portfolio_id]
+        _lifecycle_managers[portfolio_id] = (manager, now, manager.version)
+        _lifecycle_managers.move_to_end(portfolio_id)
+        excess = len(_lifecycle_managers) - LIFECYCLE_CACHE_SIZE
+        if excess > 0:
+            idle = [key for key, (cached, _, seeded_version) in _lifecycle_managers.items()
+                    if cached.version == seeded_version and key != portfolio_id]
+            for key in idle[:excess]:
+                del _lifecycle_managers[key]
+
+        # Cached responses of a replaced manager are no longer valid
+        for key in [k for k in _lifecycle_responses if k[0] == portfolio_id]:
+            del _lifecycle_responses[key]
+        return manager
+
+
+# Encoded lifecycle GET responses, keyed on (portfolio_id, ..., manager.version, today)
+LIFECYCLE_RESPONSE_CACHE_SIZE = 1024
+_lifecycle_responses = OrderedDict()
+
+
+def cached_lifecycle_response(key: tuple, build) -> Response:
+    """Serve a lifecycle GET from cache, calling ``build()`` for the payload on a miss.
+
+    ``key`` must start with the portfolio ID and include ``manager.version``
+    so any mutation through the manager invalidates it. Day counts in the
+    payloads are relative to today, so the date is part of the key as well.
+    """
+    key = key + (date.today(),)
+    with _lifecycle_lock:
+        body = _lifecycle_responses.get(key)
+        if body is not None:
+            _lifecycle_responses.move_to_end(key)
+    if body is None:
+        body = json_dumps(build())
+        with _lifecycle_lock:
+            _lifecycle_responses[key] = body
+            while len(_lifecycle_responses) > LIFECYCLE_RESPONSE_CACHE_SIZE:
+                _lifecycle_responses.popitem(last=False)
+    return conditional_json(body)
 
 
 @app.route('/api/portfolios/<portfolio_id>/lifecycle', methods=['GET'])
 def get_lifecycle_summary(portfolio_id):
     """Get lifecycle management summary for a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    portfolio = _portfolio_header_or_404(portfolio_id)
     manager = get_lifecycle_manager(portfolio_id)
 
-    summary = manager.get_portfolio_summary()
+    return cached_lifecycle_response(
+        (portfolio_id, 'summary', portfolio.name, manager.version),
+        lambda: {
+            'portfolio_id': portfolio_id,
+            'portfolio_name': portfolio.name,
+            **manager.get_portfolio_summary()
+        }
+    )
+
 
-    return jsonify({
-        'portfolio_id': portfolio_id,
-        'portfolio_name': portfolio.name,
-        **summary
-    })
+def _lifecycle_row(lifecycle, now: datetime) -> dict:
+    """Summary row for one application's lifecycle as of ``now``."""
+    return {
+        'app_id': lifecycle.app_id,
+        'app_name': lifecycle.app_name,
+        'current_stage': lifecycle.current_stage.value,
+        'current_health': lifecycle.current_health.value,
+        'days_in_stage': lifecycle.days_in_current_stage(now),
+        'expected_duration': lifecycle.expected_stage_duration_days,
+        'is_overdue': lifecycle.is_overdue_for_transition(now),
+        'lifecycle_age_days': lifecycle.lifecycle_age_days(now),
+        'business_criticality': lifecycle.business_criticality,
+        'owner': lifecycle.owner,
+        'has_sunset_plan': lifecycle.sunset_plan is not None,
+        'has_pending_transition': lifecycle.pending_transition is not None
+    }
 
 
 @app.route('/api/portfolios/<portfolio_id>/lifecycle/apps', methods=['GET'])
 def get_all_app_lifecycles(portfolio_id):
     """Get lifecycle info for all applications."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    _require_portfolio(portfolio_id)
     manager = get_lifecycle_manager(portfolio_id)
 
-    lifecycles = []
-    for app_id, lifecycle in manager.lifecycles.items():
-        lifecycles.append({
-            'app_id': lifecycle.app_id,
-            'app_name': lifecycle.app_name,
-            'current_stage': lifecycle.current_stage.value,
-            'current_health': lifecycle.current_health.value,
-            'days_in_stage': lifecycle.days_in_current_stage(),
-            'expected_duration': lifecycle.expected_stage_duration_days,
-            'is_overdue': lifecycle.is_overdue_for_transition(),
-            'lifecycle_age_days': lifecycle.lifecycle_age_days(),
-            'business_criticality': lifecycle.business_criticality,
-            'owner': lifecycle.owner,
-            'has_sunset_plan': lifecycle.sunset_plan is not None,
-            'has_pending_transition': lifecycle.pending_transition is not None
-        })
+    total_count = len(manager.lifecycles)
+    # One clock read for the whole listing, shared by every row's day counts
+    now = datetime.now()
+    rows = (_lifecycle_row(lifecycle, now) for lifecycle in manager.lifecycles.values())
 
-    return jsonify({
+    if total_count > STREAM_MIN_ITEMS:
+        return Response(stream_with_context(stream_json(
+            {'portfolio_id': portfolio_id, 'total_count': total_count}, 'applications', rows
+        )), mimetype='application/json')
+
+    return conditional_json(json_dumps({
         'portfolio_id': portfolio_id,
-        'applications': lifecycles,
-        'total_count': len(lifecycles)
-    })
+        'applications': list(rows),
+        'total_count': total_count
+    }))
 
 
 @app.route('/api/portfolios/<portfolio_id>/lifecycle/apps/<app_id>', methods=['GET'])
 def get_app_lifecycle(portfolio_id, app_id):
     """Get detailed lifecycle info for a specific application."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    _require_portfolio(portfolio_id)
     manager = get_lifecycle_manager(portfolio_id)
 
     lifecycle = manager.get_lifecycle(app_id)
     if not lifecycle:
         return jsonify({'error': 'Application not found in lifecycle manager'}), 404
 
-    # Get timeline
-    timeline = manager.get_stage_timeline(app_id)
+    return cached_lifecycle_response(
+        (portfolio_id, 'app', app_id, manager.version),
+        lambda: _app_lifecycle_detail(portfolio_id, manager, lifecycle)
+    )
 
-    # Get forecast
-    forecast = manager.forecast_lifecycle(app_id)
 
-    return jsonify({
+def _app_lifecycle_detail(portfolio_id: str, manager: LifecycleManager, lifecycle) -> dict:
+    """Full lifecycle detail payload for one application."""
+    app_id = lifecycle.app_id
+    return {
         'portfolio_id': portfolio_id,
         'app_id': app_id,
         'app_name': lifecycle.app_name,
@@ -2253,17 +2820,17 @@ def get_app_lifecycle(portfolio_id, app_id):
             'cost_per_month': lifecycle.current_metrics.cost_per_month,
             'roi_percentage': lifecycle.current_metrics.roi_percentage
         },
-        'timeline': timeline,
-        'forecast': forecast,
+        'timeline': manager.get_stage_timeline(app_id),
+        'forecast': manager.forecast_lifecycle(app_id),
         'sunset_plan': lifecycle.sunset_plan.id if lifecycle.sunset_plan else None,
         'pending_transition': lifecycle.pending_transition.id if lifecycle.pending_transition else None
-    })
+    }
 
 
 @app.route('/api/portfolios/<portfolio_id>/lifecycle/apps/<app_id>/timeline', methods=['GET'])
 def get_app_lifecycle_timeline(portfolio_id, app_id):
     """Get stage transition timeline for an application."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    _require_portfolio(portfolio_id)
     manager = get_lifecycle_manager(portfolio_id)
 
     timeline = manager.get_stage_timeline(app_id)
@@ -2281,39 +2848,35 @@ def get_app_lifecycle_timeline(portfolio_id, app_id):
 @app.route('/api/portfolios/<portfolio_id>/lifecycle/apps/<app_id>/forecast', methods=['GET'])
 def get_app_lifecycle_forecast(portfolio_id, app_id):
     """Get lifecycle forecast for an application."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    _require_portfolio(portfolio_id)
     manager = get_lifecycle_manager(portfolio_id)
 
-    forecast = manager.forecast_lifecycle(app_id)
-    if not forecast:
+    if manager.get_lifecycle(app_id) is None:
         return jsonify({'error': 'Application not found'}), 404
 
-    return jsonify({
-        'portfolio_id': portfolio_id,
-        **forecast
-    })
+    return cached_lifecycle_response(
+        (portfolio_id, 'forecast', app_id, manager.version),
+        lambda: {'portfolio_id': portfolio_id, **manager.forecast_lifecycle(app_id)}
+    )
 
 
 @app.route('/api/portfolios/<portfolio_id>/lifecycle/transitions', methods=['GET'])
 def get_pending_transitions(portfolio_id):
     """Get all pending transition requests."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    _require_portfolio(portfolio_id)
     manager = get_lifecycle_manager(portfolio_id)
 
-    pending = []
-    for request_id, request in manager.transition_requests.items():
-        if request.status == TransitionStatus.PENDING:
-            pending.append({
-                'id': request.id,
-                'app_id': request.app_id,
-                'from_stage': request.from_stage.value,
-                'to_stage': request.to_stage.value,
-                'requested_date': request.requested_date.isoformat(),
-                'requested_by': request.requested_by,
-                'reason': request.reason,
-                'status': request.status.value,
-                'checklist_items': request.checklist_items
-            })
+    pending = [{
+        'id': request.id,
+        'app_id': request.app_id,
+        'from_stage': request.from_stage.value,
+        'to_stage': request.to_stage.value,
+        'requested_date': request.requested_date.isoformat(),
+        'requested_by': request.requested_by,
+        'reason': request.reason,
+        'status': request.status.value,
+        'checklist_items': request.checklist_items
+    } for request in manager.get_pending_transitions()]
 
     return jsonify({
         'portfolio_id': portfolio_id,
@@ -2325,7 +2888,7 @@ def get_pending_transitions(portfolio_id):
 @app.route('/api/portfolios/<portfolio_id>/lifecycle/transitions', methods=['POST'])
 def request_transition(portfolio_id):
     """Request a stage transition for an application."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    _require_portfolio(portfolio_id)
     manager = get_lifecycle_manager(portfolio_id)
     data = request.get_json()
 
@@ -2337,9 +2900,8 @@ def request_transition(portfolio_id):
     if not app_id or not to_stage:
         return jsonify({'error': 'app_id and to_stage are required'}), 400
 
-    try:
-        stage = LifecycleStage(to_stage)
-    except ValueError:
+    stage = LIFECYCLE_STAGE_LOOKUP.get(to_stage) if isinstance(to_stage, str) else None
+    if stage is None:
         return jsonify({'error': f'Invalid stage: {to_stage}'}), 400
 
     transition = manager.request_transition(app_id, stage, requested_by, reason)
@@ -2363,7 +2925,7 @@ def request_transition(portfolio_id):
 @app.route('/api/portfolios/<portfolio_id>/lifecycle/transitions/<transition_id>/approve', methods=['POST'])
 def approve_transition(portfolio_id, transition_id):
     """Approve a pending transition request."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    _require_portfolio(portfolio_id)
     manager = get_lifecycle_manager(portfolio_id)
     data = request.get_json() or {}
 
@@ -2384,7 +2946,7 @@ def approve_transition(portfolio_id, transition_id):
 @app.route('/api/portfolios/<portfolio_id>/lifecycle/transitions/<transition_id>/complete', methods=['POST'])
 def complete_transition(portfolio_id, transition_id):
     """Complete an approved transition."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    _require_portfolio(portfolio_id)
     manager = get_lifecycle_manager(portfolio_id)
 
     success = manager.complete_transition(transition_id)
@@ -2401,7 +2963,7 @@ def complete_transition(portfolio_id, transition_id):
 @app.route('/api/portfolios/<portfolio_id>/lifecycle/sunset-plans', methods=['GET'])
 def get_sunset_plans(portfolio_id):
     """Get all sunset plans for a portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    _require_portfolio(portfolio_id)
     manager = get_lifecycle_manager(portfolio_id)
 
     plans = []
@@ -2431,7 +2993,7 @@ def get_sunset_plans(portfolio_id):
 @app.route('/api/portfolios/<portfolio_id>/lifecycle/sunset-plans/<plan_id>', methods=['GET'])
 def get_sunset_plan_detail(portfolio_id, plan_id):
     """Get detailed sunset plan information."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    _require_portfolio(portfolio_id)
     manager = get_lifecycle_manager(portfolio_id)
 
     plan = manager.sunset_plans.get(plan_id)
@@ -2462,7 +3024,7 @@ def get_sunset_plan_detail(portfolio_id, plan_id):
 @app.route('/api/portfolios/<portfolio_id>/lifecycle/sunset-plans', methods=['POST'])
 def create_sunset_plan(portfolio_id):
     """Create a new sunset plan."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+    _require_portfolio(portfolio_id)
     manager = get_lifecycle_manager(portfolio_id)
     data = request.get_json()
 
@@ -2475,9 +3037,8 @@ def create_sunset_plan(portfolio_id):
     if not app_id:
         return jsonify({'error': 'app_id is required'}), 400
 
-    try:
-        sunset_reason = SunsetReason(reason)
-    except ValueError:
+    sunset_reason = SUNSET_REASON_LOOKUP.get(reason) if isinstance(reason, str) else None
+    if sunset_reason is None:
         return jsonify({'error': f'Invalid reason: {reason}'}), 400
 
     target_date = datetime.now() + timedelta(days=180)
@@ -2510,108 +3071,324 @@ def create_sunset_plan(portfolio_id):
     }), 201
 
 
+# Stage metadata is fixed at import time, so encode it once and let clients cache it
+STAGE_DEFINITIONS_JSON = json_dumps({
+    'stages': [
+        {
+            'value': stage.value,
+            'name': stage.name,
+            'order': i,
+            'expected_duration_days': LifecycleManager.STAGE_DURATIONS.get(stage, 365),
+            'checklist': LifecycleManager.TRANSITION_CHECKLISTS.get(stage, [])
+        }
+        for i, stage in enumerate(LifecycleManager.STAGE_ORDER)
+    ],
+    'health_statuses': [status.value for status in HealthStatus],
+    'sunset_reasons': [reason.value for reason in SunsetReason],
+    'transition_statuses': [status.value for status in TransitionStatus]
+})
+
+
 @app.route('/api/portfolios/<portfolio_id>/lifecycle/stages', methods=['GET'])
 def get_stage_definitions(portfolio_id):
     """Get lifecycle stage definitions and metadata."""
-    return jsonify({
-        'stages': [
-            {
-                'value': stage.value,
-                'name': stage.name,
-                'order': i,
-                'expected_duration_days': LifecycleManager.STAGE_DURATIONS.get(stage, 365),
-                'checklist': LifecycleManager.TRANSITION_CHECKLISTS.get(stage, [])
-            }
-            for i, stage in enumerate(LifecycleManager.STAGE_ORDER)
-        ],
-        'health_statuses': [status.value for status in HealthStatus],
-        'sunset_reasons': [reason.value for reason in SunsetReason],
-        'transition_statuses': [status.value for status in TransitionStatus]
-    })
+    response = conditional_json(STAGE_DEFINITIONS_JSON)
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response
 
 
 @app.route('/lifecycle/<portfolio_id>')
 def lifecycle_page(portfolio_id):
     """Application lifecycle management page."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
-    return render_template('lifecycle.html', portfolio=portfolio, applications=applications)
+    portfolio = _portfolio_header_or_404(portfolio_id)
+    return render_template('lifecycle.html', portfolio=portfolio)
 
 
 # =============================================================================
 # TIER 3: ML CLUSTERING API
 # =============================================================================
 
-@app.route('/api/clustering/<portfolio_id>/analyze', methods=['POST'])
-def api_clustering_analyze(portfolio_id):
-    """Run ML clustering analysis on portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    applications = portfolio.applications.all()
-    engine = create_clustering_engine()
+# Application columns the Tier 3 engines read, loaded as plain rows instead of ORM objects.
+# Scores are normalized to 0-1 by the database in one pass, with the same fallbacks
+# the endpoints used to apply row by row (a missing or zero score takes the default).
+APP_FEATURE_COLS = (
+    Application.id, Application.name, Application.category, Application.vendor,
+    Application.cost, Application.usage, Application.time_category,
+    func.coalesce(func.nullif(Application.business_value, 0) / 100.0, 0.5).label('business_value_norm'),
+    func.coalesce(func.nullif(Application.tech_health, 0) / 100.0, 0.5).label('tech_health_norm'),
+    func.coalesce(1 - func.nullif(Application.tech_health, 0) / 100.0, 0.3).label('tech_debt_norm'),
+    func.coalesce((10 - func.nullif(Application.security, 0)) / 10.0, 0.3).label('risk_norm')
+)
 
+
+APP_FEATURE_STMT = lambda_stmt(
+    lambda: select(*APP_FEATURE_COLS).where(Application.portfolio_id == bindparam('pid'))
+)
+
+
+def _app_feature_rows(portfolio_id: str):
+    """Fetch the Tier 3 engine inputs for a portfolio's applications in one query."""
+    return db.session.execute(APP_FEATURE_STMT, {'pid': portfolio_id}).all()
+
+
+# Demo inputs for empty portfolios, generated once at import. The engines only read
+# their inputs, so every request can share the same instances.
+DEMO_CLUSTERING_APPS = create_demo_applications(25)
+DEMO_MIGRATION_PROFILES = create_demo_migration_profiles(15)
+DEMO_DASHBOARD_APPS = create_demo_portfolio_data(25)
+DEMO_BUDGET_PROFILES = create_demo_budget_profiles(20)
+DEMO_RISK_PROFILES = create_demo_risk_profiles(25)
+
+# Encoded Tier 3 analysis responses, keyed on the request, a hash of the engine inputs and the day
+ANALYSIS_CACHE_SIZE = 64
+_analysis_responses = OrderedDict()
+_analysis_lock = threading.Lock()
+
+
+def _analysis_key(name: str, portfolio_id: str, applications, *params) -> tuple:
+    """Cache key that changes whenever any application's engine inputs change.
+
+    Several engines stamp results with the clock (plan IDs and start dates,
+    trend windows), so the key also changes daily, like the lifecycle cache.
+    """
+    snapshot = hashlib.sha1(json_dumps([tuple(row) for row in applications])).hexdigest()
+    return (name, portfolio_id, snapshot, date.today()) + params
+
+
+def _store_analysis(key: tuple, body: bytes):
+    with _analysis_lock:
+        _analysis_responses[key] = body
+        while len(_analysis_responses) > ANALYSIS_CACHE_SIZE:
+            _analysis_responses.popitem(last=False)
+
+
+def _stream_and_store(key: tuple, chunks):
+    """Pass streamed chunks through, caching the complete body once it has been sent."""
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    _store_analysis(key, b''.join(parts))
+
+
+def cached_analysis_response(key: tuple, build, item_count: int) -> Response:
+    """Serve an analysis from cache, or run ``build()`` and cache its encoded result.
+
+    Identical portfolio snapshots return the same bytes without re-running the
+    engine or re-serializing. Large results are still streamed on a miss.
+    """
+    with _analysis_lock:
+        body = _analysis_responses.get(key)
+        if body is not None:
+            _analysis_responses.move_to_end(key)
+    if body is not None:
+        return conditional_json(body)
+
+    payload = build()
+    if item_count > STREAM_MIN_ITEMS:
+        return Response(stream_with_context(_stream_and_store(key, stream_json(payload))),
+                        mimetype='application/json')
+    body = json_dumps(payload)
+    _store_analysis(key, body)
+    return conditional_json(body)
+
+
+# Background analysis jobs. The engines are CPU-bound pure Python, so they run in
+# worker processes rather than threads; inputs are plain rows and results plain dicts.
+# Jobs are tracked in this process only, so polling /api/jobs/<job_id> needs a
+# single web worker (see gunicorn.conf.py) until job state is shared.
+ANALYSIS_JOB_LIMIT = 256
+ANALYSIS_POOL_SIZE = int(os.environ.get('ANALYSIS_POOL_SIZE', 2))
+_analysis_pool = None
+_analysis_jobs = OrderedDict()
+_analysis_jobs_lock = threading.Lock()
+# Waits on the worker pool and writes finished analyses; one thread per worker
+_analysis_saver = ThreadPoolExecutor(max_workers=ANALYSIS_POOL_SIZE, thread_name_prefix='analysis-save')
+
+
+def _gevent_patched() -> bool:
+    """True when running in a gevent-monkey-patched process (the gunicorn worker)."""
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched('threading')
+
+
+def _get_analysis_pool():
+    """Start the worker pool on first use so importing the app never forks.
+
+    A gevent-patched process is not forked: jobs run on one native thread
+    instead, which keeps the hub responsive. That thread runs alongside the
+    request greenlets, so job functions build their own engines (or use only
+    read-only shared state such as the compliance catalog).
+    """
+    global _analysis_pool
+    with _analysis_jobs_lock:
+        if _analysis_pool is None:
+            if _gevent_patched():
+                from gevent.threadpool import ThreadPoolExecutor as NativeThreadPoolExecutor
+                _analysis_pool = NativeThreadPoolExecutor(max_workers=1)
+            else:
+                _analysis_pool = ProcessPoolExecutor(max_workers=ANALYSIS_POOL_SIZE)
+        return _analysis_pool
+
+
+def _cache_finished_analysis(key: tuple, future):
+    if not future.cancelled() and future.exception() is None:
+        _store_analysis(key, json_dumps(future.result()))
+
+
+def submit_analysis_job(key, fn, *args):
+    """Queue ``fn(*args)`` on the worker pool and return ``202`` with a job ID.
+
+    A result already in the analysis cache is returned straight away instead.
+    Finished jobs populate the cache, so the synchronous endpoint benefits too.
+    """
+    if key is not None:
+        with _analysis_lock:
+            body = _analysis_responses.get(key)
+        if body is not None:
+            return conditional_json(body)
+
+    future = _get_analysis_pool().submit(fn, *args)
+    if key is not None:
+        future.add_done_callback(lambda f: _cache_finished_analysis(key, f))
+    return _track_analysis_job(future)
+
+
+def submit_saved_analysis_job(fn, args: tuple, save, *save_args):
+    """Queue ``fn(*args)`` on the worker pool and store its result as a job.
+
+    The result is written by ``save(result, *save_args)`` inside an app context
+    on a saver thread, and whatever ``save`` returns becomes the job result.
+    """
+    def run():
+        result = _get_analysis_pool().submit(fn, *args).result()
+        with app.app_context():
+            return save(result, *save_args)
+
+    return _track_analysis_job(_analysis_saver.submit(run))
+
+
+def _track_analysis_job(future):
+    job_id = str(uuid.uuid4())
+    with _analysis_jobs_lock:
+        _analysis_jobs[job_id] = future
+        while len(_analysis_jobs) > ANALYSIS_JOB_LIMIT:
+            _analysis_jobs.popitem(last=False)
+    return jsonify({'success': True, 'job_id': job_id, 'status': 'pending'}), 202
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_analysis_job(job_id):
+    """Poll a background analysis job; ``result`` is set once it has finished."""
+    with _analysis_jobs_lock:
+        future = _analysis_jobs.get(job_id)
+    if future is None:
+        return jsonify({'error': 'Unknown analysis job'}), 404
+    if not future.done():
+        return jsonify({'job_id': job_id, 'status': 'pending'})
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Analysis job {job_id} failed: {error}")
+        return jsonify({'job_id': job_id, 'status': 'failed', 'error': str(error)})
+    return jsonify({'job_id': job_id, 'status': 'finished', 'result': future.result()})
+
+
+def run_clustering(applications, num_clusters) -> dict:
+    """Cluster a portfolio's feature rows (or the demo set when it is empty)."""
+    engine = create_clustering_engine()
     if not applications:
-        demo_apps = create_demo_applications(25)
-        engine.add_applications(demo_apps)
+        engine.add_applications(DEMO_CLUSTERING_APPS)
     else:
         for app in applications:
             features = ApplicationFeatures(
                 app_id=str(app.id), app_name=app.name,
-                business_value=app.business_value / 100 if app.business_value else 0.5,
-                technical_health=app.tech_health / 100 if app.tech_health else 0.5,
-                cost_efficiency=0.5, risk_score=(10 - app.security) / 10 if app.security else 0.3,
+                business_value=app.business_value_norm,
+                technical_health=app.tech_health_norm,
+                cost_efficiency=0.5, risk_score=app.risk_norm,
                 user_adoption=0.5, integration_complexity=0.5, compliance_score=0.7, modernization_readiness=0.5,
                 category=app.category or '', vendor=app.vendor or '',
                 annual_cost=app.cost or 0, user_count=int(app.usage or 0)
             )
             engine.add_application(features)
 
+    result = engine.cluster_applications(method=ClusteringMethod.KMEANS, num_clusters=num_clusters)
+    return result.to_dict()
+
+
+@app.route('/api/clustering/<portfolio_id>/analyze', methods=['POST'])
+def api_clustering_analyze(portfolio_id):
+    """Run ML clustering analysis on portfolio.
+
+    Pass ``"background": true`` to run it as a job; see /api/jobs/<job_id>.
+    """
+    _require_portfolio(portfolio_id)
+    applications = _app_feature_rows(portfolio_id)
     data = request.get_json() or {}
-    result = engine.cluster_applications(method=ClusteringMethod.KMEANS, num_clusters=data.get('num_clusters'))
-    return jsonify(result.to_dict())
+    num_clusters = data.get('num_clusters')
+
+    key = _analysis_key('clustering', portfolio_id, applications, num_clusters)
+    if data.get('background'):
+        return submit_analysis_job(key, run_clustering, applications, num_clusters)
+    return cached_analysis_response(key, lambda: run_clustering(applications, num_clusters), len(applications))
 
 
 @app.route('/clustering/<portfolio_id>')
 def clustering_page(portfolio_id):
     """ML Clustering analysis page."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    return render_template('clustering.html', portfolio=portfolio, applications=portfolio.applications.all())
+    portfolio = _portfolio_header_or_404(portfolio_id)
+    return render_template('clustering.html', portfolio=portfolio)
 
 
 # =============================================================================
 # TIER 3: MIGRATION PLANNER API
 # =============================================================================
 
-@app.route('/api/migration/<portfolio_id>/plan', methods=['POST'])
-def api_migration_plan(portfolio_id):
-    """Generate migration plan for portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    data = request.get_json() or {}
-    provider = CloudProvider(data.get('provider', 'aws')) if data.get('provider') in [p.value for p in CloudProvider] else CloudProvider.AWS
+def run_migration_plan(applications, portfolio_name: str, provider: CloudProvider) -> dict:
+    """Build a migration plan from a portfolio's feature rows (or the demo set)."""
     planner = create_migration_planner(preferred_provider=provider)
-
-    applications = portfolio.applications.all()
     if not applications:
-        planner.add_applications(create_demo_migration_profiles(15))
+        planner.add_applications(DEMO_MIGRATION_PROFILES)
     else:
         for app in applications:
             profile = ApplicationMigrationProfile(
                 app_id=str(app.id), app_name=app.name,
-                cloud_readiness=app.tech_health / 100 if app.tech_health else 0.5,
-                business_criticality=app.business_value / 100 if app.business_value else 0.5,
-                technical_debt=1 - (app.tech_health / 100) if app.tech_health else 0.3,
+                cloud_readiness=app.tech_health_norm,
+                business_criticality=app.business_value_norm,
+                technical_debt=app.tech_debt_norm,
                 current_annual_cost=app.cost or 0, estimated_users=int(app.usage or 0)
             )
             planner.add_application(profile)
 
-    plan = planner.create_migration_plan(portfolio_name=portfolio.name)
-    return jsonify(plan.to_dict())
+    return planner.create_migration_plan(portfolio_name=portfolio_name).to_dict()
+
+
+@app.route('/api/migration/<portfolio_id>/plan', methods=['POST'])
+def api_migration_plan(portfolio_id):
+    """Generate migration plan for portfolio.
+
+    Pass ``"background": true`` to run it as a job; see /api/jobs/<job_id>.
+    """
+    portfolio = _portfolio_header_or_404(portfolio_id)
+    data = request.get_json() or {}
+    provider = CloudProvider(data.get('provider', 'aws')) if data.get('provider') in [p.value for p in CloudProvider] else CloudProvider.AWS
+    applications = _app_feature_rows(portfolio_id)
+
+    key = _analysis_key('migration', portfolio_id, applications, portfolio.name, provider.value)
+    if data.get('background'):
+        return submit_analysis_job(key, run_migration_plan, applications, portfolio.name, provider)
+    return cached_analysis_response(key, lambda: run_migration_plan(applications, portfolio.name, provider),
+                                    len(applications))
 
 
 @app.route('/migration/<portfolio_id>')
 def migration_page(portfolio_id):
     """Migration planner page."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    return render_template('migration.html', portfolio=portfolio, applications=portfolio.applications.all())
+    portfolio = _portfolio_header_or_404(portfolio_id)
+    return render_template('migration.html', portfolio=portfolio)
 
 
 # =============================================================================
@@ -2621,89 +3398,99 @@ def migration_page(portfolio_id):
 @app.route('/api/portfolio-dashboard/<portfolio_id>')
 def api_portfolio_dashboard(portfolio_id):
     """Get executive portfolio dashboard data."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    engine = create_portfolio_dashboard_engine()
-
-    applications = portfolio.applications.all()
-    if not applications:
-        engine.add_applications(create_demo_portfolio_data(25))
-    else:
-        for app in applications:
-            app_data = ApplicationData(
-                app_id=str(app.id), app_name=app.name,
-                annual_cost=app.cost or 0, user_count=int(app.usage or 0), age_years=3.0,
-                business_value=app.business_value / 100 if app.business_value else 0.5,
-                technical_health=app.tech_health / 100 if app.tech_health else 0.5,
-                risk_score=(10 - app.security) / 10 if app.security else 0.3,
-                time_recommendation=app.time_category or 'tolerate',
-                category=app.category or '', vendor=app.vendor or ''
-            )
-            engine.add_application(app_data)
-
-    dashboard = engine.generate_dashboard(portfolio_id, portfolio.name)
-    return jsonify(dashboard.to_dict())
+    portfolio = _portfolio_header_or_404(portfolio_id)
+    applications = _app_feature_rows(portfolio_id)
+
+    def build():
+        engine = create_portfolio_dashboard_engine()
+        if not applications:
+            engine.add_applications(DEMO_DASHBOARD_APPS)
+        else:
+            for app in applications:
+                app_data = ApplicationData(
+                    app_id=str(app.id), app_name=app.name,
+                    annual_cost=app.cost or 0, user_count=int(app.usage or 0), age_years=3.0,
+                    business_value=app.business_value_norm,
+                    technical_health=app.tech_health_norm,
+                    risk_score=app.risk_norm,
+                    time_recommendation=app.time_category or 'tolerate',
+                    category=app.category or '', vendor=app.vendor or ''
+                )
+                engine.add_application(app_data)
+
+        return engine.generate_dashboard(portfolio_id, portfolio.name).to_dict()
+
+    key = _analysis_key('dashboard', portfolio_id, applications, portfolio.name)
+    return cached_analysis_response(key, build, len(applications))
 
 
 @app.route('/executive-dashboard/<portfolio_id>')
 def executive_dashboard_page(portfolio_id):
     """Executive portfolio dashboard page."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    return render_template('executive_dashboard.html', portfolio=portfolio, applications=portfolio.applications.all())
+    portfolio = _portfolio_header_or_404(portfolio_id)
+    return render_template('executive_dashboard.html', portfolio=portfolio)
 
 
 # =============================================================================
 # TIER 3: BUDGET OPTIMIZER API
 # =============================================================================
 
-@app.route('/api/budget/<portfolio_id>/optimize', methods=['POST'])
-def api_budget_optimize(portfolio_id):
-    """Optimize budget allocation for portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    data = request.get_json() or {}
-    total_budget = data.get('total_budget', 1000000)
+def run_budget_optimization(applications, total_budget: float, include_what_if: bool,
+                            include_multi_year: bool) -> dict:
+    """Optimize budget allocation over a portfolio's feature rows (or the demo set)."""
     optimizer = create_budget_optimizer()
-
-    applications = portfolio.applications.all()
     if not applications:
-        optimizer.add_applications(create_demo_budget_profiles(20))
+        optimizer.add_applications(DEMO_BUDGET_PROFILES)
     else:
         for app in applications:
             profile = ApplicationBudgetProfile(
                 app_id=str(app.id), app_name=app.name,
                 current_budget=app.cost or 50000, current_cost=app.cost or 50000,
-                business_value=app.business_value / 100 if app.business_value else 0.5,
-                technical_health=app.tech_health / 100 if app.tech_health else 0.5,
-                risk_score=(10 - app.security) / 10 if app.security else 0.3,
+                business_value=app.business_value_norm,
+                technical_health=app.tech_health_norm,
+                risk_score=app.risk_norm,
                 category=app.category or ''
             )
             optimizer.add_application(profile)
 
     result = optimizer.full_optimization(total_budget=total_budget,
-        include_what_if=data.get('include_what_if', True),
-        include_multi_year=data.get('include_multi_year', True))
-    return jsonify(result.to_dict())
+        include_what_if=include_what_if,
+        include_multi_year=include_multi_year)
+    return result.to_dict()
+
+
+@app.route('/api/budget/<portfolio_id>/optimize', methods=['POST'])
+def api_budget_optimize(portfolio_id):
+    """Optimize budget allocation for portfolio.
+
+    Pass ``"background": true`` to run it as a job; see /api/jobs/<job_id>.
+    """
+    _require_portfolio(portfolio_id)
+    data = request.get_json() or {}
+    args = (_app_feature_rows(portfolio_id), data.get('total_budget', 1000000),
+            data.get('include_what_if', True), data.get('include_multi_year', True))
+
+    if data.get('background'):
+        return submit_analysis_job(None, run_budget_optimization, *args)
+    return jsonify(run_budget_optimization(*args))
 
 
 @app.route('/budget/<portfolio_id>')
 def budget_page(portfolio_id):
     """Budget optimization page."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    return render_template('budget.html', portfolio=portfolio, applications=portfolio.applications.all())
+    portfolio = _portfolio_header_or_404(portfolio_id)
+    return render_template('budget.html', portfolio=portfolio)
 
 
 # =============================================================================
 # TIER 3: RISK HEAT MAP API
 # =============================================================================
 
-@app.route('/api/risk-heatmap/<portfolio_id>')
-def api_risk_heatmap(portfolio_id):
-    """Get risk heat map data for portfolio."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
+def run_risk_heatmap(applications) -> dict:
+    """Score risk across a portfolio's feature rows (or the demo set)."""
     engine = create_risk_heatmap_engine()
-
-    applications = portfolio.applications.all()
     if not applications:
-        engine.add_applications(create_demo_risk_profiles(25))
+        engine.add_applications(DEMO_RISK_PROFILES)
     else:
         for app in applications:
             profile = create_demo_risk_profiles(1)[0]
@@ -2713,15 +3500,29 @@ def api_risk_heatmap(portfolio_id):
             profile.vendor = app.vendor or 'Unknown'
             engine.add_application(profile)
 
-    result = engine.generate_analysis()
-    return jsonify(result.to_dict())
+    return engine.generate_analysis().to_dict()
+
+
+@app.route('/api/risk-heatmap/<portfolio_id>')
+def api_risk_heatmap(portfolio_id):
+    """Get risk heat map data for portfolio.
+
+    Pass ``?background=1`` to run it as a job; see /api/jobs/<job_id>.
+    """
+    _require_portfolio(portfolio_id)
+    applications = _app_feature_rows(portfolio_id)
+
+    key = _analysis_key('risk_heatmap', portfolio_id, applications)
+    if request.args.get('background') in ('1', 'true'):
+        return submit_analysis_job(key, run_risk_heatmap, applications)
+    return cached_analysis_response(key, lambda: run_risk_heatmap(applications), len(applications))
 
 
 @app.route('/risk-heatmap/<portfolio_id>')
 def risk_heatmap_page(portfolio_id):
     """Risk heat map page."""
-    portfolio = Portfolio.query.get_or_404(portfolio_id)
-    return render_template('risk_heatmap.html', portfolio=portfolio, applications=portfolio.applications.all())
+    portfolio = _portfolio_header_or_404(portfolio_id)
+    return render_template('risk_heatmap.html', portfolio=portfolio)
 
 
 # =============================================================================